@@ -0,0 +1,151 @@
+import bisect
+import collections
+
+BUCKETS = ("0-30", "31-60", "61-90", "90+")
+
+AgingRow = collections.namedtuple("AgingRow", "tenant buckets total")
+
+
+def bucket_for(age_days):
+    if age_days <= 30:
+        return "0-30"
+    if age_days <= 60:
+        return "31-60"
+    if age_days <= 90:
+        return "61-90"
+    return "90+"
+
+
+class AgingLedger:
+    """Dated charges and payments per tenant, with payments applied to the oldest charge first.
+
+    The open charges after every entry are kept up to date, and totalled per
+    charge date, so aging as of any date on or after the latest entry costs one
+    pass over distinct dates. Aging as of an earlier date replays each tenant's
+    history, ignoring charges and payments dated after it.
+    """
+
+    def __init__(self):
+        self._charges = {}
+        self._payments = {}
+        self._open = {}
+        self._credit = {}
+        self._outstanding_by_date = collections.Counter()
+        self._latest = None
+
+    def charge(self, tenant, amount, date):
+        self._seen(date)
+        charges = self._charges.setdefault(tenant, [])
+        if charges and date < charges[-1][0]:
+            # Back-dated: the oldest-first allocation changes, so redo it for this tenant.
+            bisect.insort(charges, (date, amount))
+            self._reallocate(tenant)
+            return
+        charges.append((date, amount))
+        credit = self._credit.pop(tenant, 0)
+        if credit >= amount:
+            if credit > amount:
+                self._credit[tenant] = credit - amount
+            return
+        amount -= credit
+        self._open.setdefault(tenant, collections.deque()).append([date, amount])
+        self._outstanding_by_date[date] += amount
+
+    def pay(self, tenant, amount, date):
+        self._seen(date)
+        bisect.insort(self._payments.setdefault(tenant, []), (date, amount))
+        charges = self._open.get(tenant)
+        while charges and amount > 0:
+            charge = charges[0]
+            applied = min(amount, charge[1])
+            charge[1] -= applied
+            amount -= applied
+            self._release(charge[0], applied)
+            if charge[1] == 0:
+                charges.popleft()
+        if charges is not None and not charges:
+            del self._open[tenant]
+        if amount > 0:
+            self._credit[tenant] = self._credit.get(tenant, 0) + amount
+
+    def remove_tenant(self, tenant):
+        for date, remaining in self._open.pop(tenant, ()):
+            self._release(date, remaining)
+        self._credit.pop(tenant, None)
+        self._charges.pop(tenant, None)
+        self._payments.pop(tenant, None)
+
+    def _seen(self, date):
+        if self._latest is None or date > self._latest:
+            self._latest = date
+
+    def _release(self, date, amount):
+        self._outstanding_by_date[date] -= amount
+        if self._outstanding_by_date[date] <= 0:
+            del self._outstanding_by_date[date]
+
+    def _reallocate(self, tenant):
+        for date, remaining in self._open.pop(tenant, ()):
+            self._release(date, remaining)
+        self._credit.pop(tenant, None)
+        charges, credit = self._replay(tenant)
+        if charges:
+            self._open[tenant] = collections.deque(charges)
+            for date, remaining in charges:
+                self._outstanding_by_date[date] += remaining
+        if credit:
+            self._credit[tenant] = credit
+
+    def _replay(self, tenant, as_of=None):
+        """Returns the tenant's open [date, amount] charges and credit, counting only entries up to as_of."""
+        paid = sum(amount for date, amount in self._payments.get(tenant, ())
+                   if as_of is None or date <= as_of)
+        charges = []
+        for date, amount in self._charges.get(tenant, ()):
+            if as_of is not None and date > as_of:
+                break
+            applied = min(paid, amount)
+            paid -= applied
+            if amount > applied:
+                charges.append([date, amount - applied])
+        return charges, paid
+
+    def _is_current(self, as_of):
+        return self._latest is None or as_of >= self._latest
+
+    def _open_as_of(self, as_of):
+        """Yields (tenant, open charges) as of a date, replaying only if later entries exist."""
+        if self._is_current(as_of):
+            yield from self._open.items()
+            return
+        for tenant in self._charges:
+            charges = self._replay(tenant, as_of)[0]
+            if charges:
+                yield tenant, charges
+
+    def outstanding(self, tenant):
+        return sum(remaining for _, remaining in self._open.get(tenant, ()))
+
+    def buckets(self, as_of, tenant=None):
+        """Returns open amounts by age bucket for one tenant, or for everyone if tenant is None."""
+        totals = dict.fromkeys(BUCKETS, 0)
+        if tenant is not None:
+            entries = self._open.get(tenant, ()) if self._is_current(as_of) else self._replay(tenant, as_of)[0]
+        elif self._is_current(as_of):
+            entries = self._outstanding_by_date.items()
+        else:
+            entries = (entry for _, charges in self._open_as_of(as_of) for entry in charges)
+        for date, amount in entries:
+            totals[bucket_for((as_of - date).days)] += amount
+        return totals
+
+    def report(self, as_of):
+        """Returns an AgingRow for every tenant with charges open as of as_of, oldest debt first."""
+        rows = []
+        for tenant, charges in self._open_as_of(as_of):
+            buckets = dict.fromkeys(BUCKETS, 0)
+            for date, amount in charges:
+                buckets[bucket_for((as_of - date).days)] += amount
+            rows.append((charges[0][0], AgingRow(tenant, buckets, sum(buckets.values()))))
+        rows.sort(key=lambda row: row[0])
+        return [row for _, row in rows]
@@ -1,19 +1,92 @@
 import datetime
 
+from apartment_manager.aging import BUCKETS, AgingLedger
+from apartment_manager.changefeed import ChangeFeed
+from apartment_manager.identity import EntityList, EntityTable, InternTable
+from apartment_manager.intervals import LeaseIntervalIndex
+from apartment_manager.lazy import LazyList
+from apartment_manager.maintenance import CLOSED_STATUSES, MaintenanceStats
+from apartment_manager.results import (
+    ApartmentRecord, LeaseRecord, MonthlyReport, OccupancyReport, TenantProfile,
+)
+from apartment_manager.tenant_index import TenantIndex, normalize_name
+
+def _to_date(value):
+    if isinstance(value, datetime.date):
+        return value
+    return datetime.datetime.strptime(value, "%Y-%m-%d").date()
+
+class _SearchField:
+    """Apartment attribute held in the search index, refreshed there whenever it is assigned."""
+
+    def __set_name__(self, owner, name):
+        self.slot = "_" + name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return instance.__dict__[self.slot]
+
+    def __set__(self, instance, value):
+        instance.__dict__[self.slot] = value
+        index = instance.__dict__.get("search_index")
+        if index is not None:
+            index.reindex(instance)
+
+
 class Apartment:
-    def __init__(self, unit_number, bedrooms, bathrooms, rent):
+    maintenance_requests = LazyList()
+    rent = _SearchField()
+    bedrooms = _SearchField()
+    bathrooms = _SearchField()
+
+    def __init__(self, unit_number, bedrooms, bathrooms, rent, maintenance_loader=None):
+        # The search index holding this apartment, if one has been built; set by the index itself.
+        self.search_index = None
         self.unit_number = unit_number
         self.bedrooms = bedrooms
         self.bathrooms = bathrooms
         self.rent = rent
-        self.is_available = True
-        self.maintenance_requests = []
+        self.id = None
+        # The owning manager's booking calendar; None for apartments built on their own.
+        self.calendar = None
+        # The owning manager's maintenance counters, kept in step with status changes.
+        self.maintenance_stats = None
+        self._loaders = {"maintenance_requests": maintenance_loader} if maintenance_loader else {}
+        self.leases = {}
+
+    def lease_on(self, day):
+        """The lease covering day, according to the booking calendar."""
+        if self.calendar is not None:
+            return self.calendar.lease_at(self, day)
+        return next((l for l in self.leases.values() if l.start_date <= day <= l.end_date), None)
+
+    def current_lease(self):
+        """The lease covering today, else the next booking to start, else the most recent one."""
+        today = datetime.date.today()
+        if self.calendar is not None:
+            return self.calendar.nearest(self, today)
+        leases = self.leases.values()
+        upcoming = [l for l in leases if l.start_date > today]
+        return (self.lease_on(today) or min(upcoming, key=lambda l: l.start_date, default=None)
+                or max(leases, key=lambda l: l.end_date, default=None))
+
+    @property
+    def is_available(self):
+        """Whether no lease covers today, according to the booking calendar."""
+        return self.lease_on(datetime.date.today()) is None
 
     def add_maintenance_request(self, request):
         self.maintenance_requests.append(request)
     def update_request_status(self, index, status):
         if 0 <= index < len(self.maintenance_requests):
-            self.maintenance_requests[index]["status"] = status
+            request = self.maintenance_requests[index]
+            now = datetime.datetime.now()
+            if self.maintenance_stats is not None:
+                self.maintenance_stats.status_changed(self.unit_number, request, status, now)
+            else:
+                request["status"] = status
+                request.setdefault("timestamps", {})[status] = now
     def calculate_annual_rent(self):
         return self.rent * 12
     def __str__(self):
@@ -22,17 +95,40 @@ class Apartment:
                 f"${self.rent}/month, Status: {status}")
 
 class Tenant:
-    def __init__(self, name, phone, email):
+    payment_history = LazyList()
+
+    def __init__(self, name, phone, email, payment_loader=None):
         self.name = name
         self.phone = phone
         self.email = email
         self.balance_due = 0
-        self.payment_history = []
+        self.id = None
+        # The owning manager's aging ledger and change feed; None for tenants built on their own.
+        self.ledger = None
+        self.changes = None
+        self._loaders = {"payment_history": payment_loader} if payment_loader else {}
+        self.leases = {}
+
+    def make_payment(self, amount, date=None):
+        date = _to_date(date) if date else datetime.date.today()
+        self.apply_payment(amount, date)
+        self.payment_history.append({"amount": amount, "date": date})
+        return f"Payment of ${amount} made. Remaining balance: ${self.balance_due}"
+
+    def apply_payment(self, amount, date, lease=None):
+        """Takes a payment off the balance and, for a managed tenant, off the oldest open charges.
 
-    def make_payment(self, amount):
+        Managed tenants also record the payment in the change feed, with the lease id
+        when it was paid against a lease.
+        """
+        date = _to_date(date)
         self.balance_due -= amount
-        self.payment_history.append({"amount": amount, "date": datetime.date.today()})
-        return f"Payment of ${amount} made. Remaining balance: ${self.balance_due}"
+        if self.ledger is not None:
+            self.ledger.pay(self.id, amount, date)
+        if self.changes is not None:
+            extra = {"lease": lease.id} if lease is not None else {}
+            self.changes.record("payment", "add", self.name, id=self.id, amount=amount, date=date,
+                                balance_due=self.balance_due, **extra)
 
     def get_payment_history(self):
         """Returns the payment history for the tenant."""
@@ -43,24 +139,37 @@ class Tenant:
 
 
 class Lease:
-    def __init__(self, tenant, apartment, start_date, end_date):
+    def __init__(self, tenant, apartment, start_date, end_date, lease_id=None):
+        self.id = lease_id
         self.tenant = tenant
         self.apartment = apartment
-        self.start_date = datetime.datetime.strptime(start_date, "%Y-%m-%d").date()
-        self.end_date = datetime.datetime.strptime(end_date, "%Y-%m-%d").date()
+        self.start_date = _to_date(start_date)
+        self.end_date = _to_date(end_date)
         self.payments = []
-        self.apartment.is_available = False
+        # Back-references map lease id to lease, in insertion order, so unlinking is O(1).
+        self.tenant.leases[self.key] = self
+        self.apartment.leases[self.key] = self
+
+    @property
+    def key(self):
+        """The back-reference key: the lease id, or the lease itself if it was built without one."""
+        return self.id if self.id is not None else self
 
     def add_payment(self, amount, date):
         self.payments.append({"amount": amount, "date": date})
-        self.tenant.balance_due -= amount
+        self.tenant.apply_payment(amount, date, self)
 
     def calculate_remaining_days(self):
         today = datetime.date.today()
         return (self.end_date - today).days if today <= self.end_date else 0
 
+    def unlink(self):
+        """Drops the lease from its tenant's and apartment's back-references."""
+        self.tenant.leases.pop(self.key, None)
+        self.apartment.leases.pop(self.key, None)
+
     def terminate_lease(self):
-        self.apartment.is_available = True
+        self.unlink()
         return f"Lease for {self.apartment.unit_number} terminated."
 
     def is_overdue(self):
@@ -76,67 +185,237 @@ class Lease:
 
 class ApartmentManager:
     def __init__(self):
-        self.apartments = []
-        self.tenants = []
-        self.leases = []
-
-    def add_apartment(self, unit_number, bedrooms, bathrooms, rent):
-        self.apartments.append(Apartment(unit_number, bedrooms, bathrooms, rent))
-
-    def add_tenant(self, name, phone, email):
-        tenant = Tenant(name, phone, email)
+        # Insertion-ordered like lists, but a delete unlinks one entity in O(1).
+        self.apartments = EntityList()
+        self.tenants = EntityList()
+        self.leases = EntityList()
+        self._projection = None
+        self.tenant_index = TenantIndex()
+        # Every entity gets a dense integer id; unit numbers are interned so the
+        # per-unit lookup is a list indexed by unit id.
+        self.apartment_table = EntityTable()
+        self.tenant_table = EntityTable()
+        self.lease_table = EntityTable()
+        self.request_table = EntityTable()
+        self.unit_keys = InternTable()
+        self._apartments_by_unit = []
+        self._apartment_index = None
+        self.changes = ChangeFeed()
+        self.aging = AgingLedger()
+        self.lease_intervals = LeaseIntervalIndex()
+        self.maintenance_stats = MaintenanceStats()
+
+    @property
+    def projection(self):
+        if self._projection is None:
+            from apartment_manager.projection import RentProjection
+            self._projection = RentProjection(self)
+        return self._projection
+
+    @property
+    def apartments(self):
+        return self._apartments
+
+    @apartments.setter
+    def apartments(self, apartments):
+        # A replaced list invalidates the search index; it is rebuilt on the next query.
+        self._apartments = EntityList(apartments)
+        self._apartment_index = None
+
+    @property
+    def apartment_index(self):
+        from apartment_manager.query import ApartmentIndex
+        if self._apartment_index is None:
+            self._apartment_index = ApartmentIndex(self.apartments)
+        return self._apartment_index
+
+    def _invalidate_projection(self, start, end):
+        # Nothing can be cached before the projection engine is first used.
+        if self._projection is not None:
+            self._projection.invalidate(start, end)
+
+    def add_apartment(self, unit_number, bedrooms, bathrooms, rent, maintenance_loader=None):
+        apartment = Apartment(unit_number, bedrooms, bathrooms, rent, maintenance_loader)
+        apartment.id = self.apartment_table.add(apartment)
+        apartment.calendar = self.lease_intervals
+        apartment.maintenance_stats = self.maintenance_stats
+        self.apartments.append(apartment)
+        unit_id = self.unit_keys.intern(unit_number)
+        if unit_id == len(self._apartments_by_unit):
+            self._apartments_by_unit.append([])
+        self._apartments_by_unit[unit_id].append(apartment)
+        if self._apartment_index is not None:
+            self._apartment_index.add(apartment)
+        self.changes.record("apartment", "add", unit_number, id=apartment.id,
+                            bedrooms=bedrooms, bathrooms=bathrooms, rent=rent)
+        return apartment
+
+    def set_rent(self, unit_number, rent):
+        apartment = self.find_apartment(unit_number)
+        if apartment is None:
+            return "Apartment not found."
+        old_rent = apartment.rent
+        apartment.rent = rent
+        self._invalidate_projection(None, None)
+        self.changes.record("apartment", "update", unit_number, id=apartment.id, rent=rent)
+        return f"Rent for Unit {unit_number} changed from ${old_rent} to ${rent}."
+
+    def find_apartment(self, unit_number):
+        unit_id = self.unit_keys.get(unit_number)
+        matches = self._apartments_by_unit[unit_id] if unit_id is not None else None
+        return matches[0] if matches else None
+
+    def apartment_by_id(self, apartment_id):
+        return self.apartment_table.get(apartment_id)
+
+    def add_tenant(self, name, phone, email, payment_loader=None):
+        tenant = Tenant(name, phone, email, payment_loader)
+        tenant.id = self.tenant_table.add(tenant)
+        tenant.ledger = self.aging
+        tenant.changes = self.changes
         self.tenants.append(tenant)
+        self.tenant_index.add(tenant)
+        self.changes.record("tenant", "add", name, id=tenant.id, phone=phone, email=email)
         return tenant
 
+    def find_tenant(self, tenant):
+        """Looks a tenant up by id, or by name (the first tenant added under that name)."""
+        if isinstance(tenant, int):
+            return self.tenant_table.get(tenant)
+        matches = self.tenant_index.by_name(tenant)
+        return matches[0] if matches else None
+
+    def tenant_ids(self, name):
+        """Ids of every tenant with this name, oldest first, to tell duplicate names apart."""
+        return [tenant.id for tenant in self.tenant_index.by_name(name)]
+
+    def lease_by_id(self, lease_id):
+        return self.lease_table.get(lease_id)
+
+    def maintenance_request_by_id(self, request_id):
+        return self.request_table.get(request_id)
+
+    def search_tenants(self, prefix=None, phone=None, email=None, limit=20):
+        """Returns tenants matching every given criterion: name prefix, phone and/or email."""
+        candidates = None
+        if phone is not None:
+            candidates = self.tenant_index.by_phone(phone)
+        if email is not None:
+            by_email = self.tenant_index.by_email(email)
+            candidates = by_email if candidates is None else [t for t in candidates if t in by_email]
+        if prefix is not None:
+            if candidates is None:
+                return self.tenant_index.by_prefix(prefix, limit)
+            prefix = normalize_name(prefix)
+            candidates = [t for t in candidates if normalize_name(t.name).startswith(prefix)]
+        return (candidates or [])[:limit]
+
     def lease_apartment(self, tenant_name, unit_number, start_date, end_date):
-        tenant = next((t for t in self.tenants if t.name == tenant_name), None)
-        apartment = next(
-            (a for a in self.apartments if a.unit_number == unit_number), None
-        )
-        if tenant and apartment and apartment.is_available:
-            lease = Lease(tenant, apartment, start_date, end_date)
-            tenant.balance_due += apartment.rent
-            self.leases.append(lease)
-            return lease
+        tenant = self.find_tenant(tenant_name)
+        apartment = self.find_apartment(unit_number)
+        start, end = _to_date(start_date), _to_date(end_date)
+        if start > end:
+            raise ValueError("Lease end date is before its start date.")
+        # A unit already under lease can still be booked for dates after that lease ends.
+        if tenant and apartment and self.lease_intervals.covering(apartment, start, end) is None:
+            return self._open_lease(tenant, apartment, start, end)
         raise ValueError("Tenant or apartment not found, or apartment not available.")
 
-    def search_apartments(self, min_rent=None, max_rent=None, bedrooms=None, bathrooms=None, min_bedrooms=None, max_bedrooms=None, min_bathrooms=None, max_bathrooms=None, include_occupied=False):
-        results = []
+    def available_on(self, unit_number, day):
+        """Whether the unit is free of leases on the given date, derived from its booking calendar."""
+        apartment = self.find_apartment(unit_number)
+        if apartment is None:
+            raise ValueError("Apartment not found.")
+        return self.lease_intervals.lease_at(apartment, _to_date(day)) is None
+
+    def bookings(self, unit_number):
+        """Returns the unit's current and future leases in date order."""
+        apartment = self.find_apartment(unit_number)
+        return self.lease_intervals.leases_for(apartment) if apartment else []
+
+    def _open_lease(self, tenant, apartment, start_date, end_date):
+        lease = Lease(tenant, apartment, start_date, end_date, self.lease_table.next_id)
+        self.lease_table.add(lease)
+        tenant.balance_due += apartment.rent
+        self.aging.charge(tenant.id, apartment.rent, lease.start_date)
+        self.leases.append(lease)
+        self.lease_intervals.add(lease)
+        self._invalidate_projection(lease.start_date, lease.end_date)
+        self.changes.record("lease", "add", apartment.unit_number, id=lease.id, tenant=tenant.name,
+                            start_date=lease.start_date, end_date=lease.end_date,
+                            balance_due=tenant.balance_due)
+        return lease
+
+    def make_payment(self, tenant_name, amount):
+        tenant = self.find_tenant(tenant_name)
+        if tenant:
+            return tenant.make_payment(amount)
+        return "Tenant not found."
 
-        for apartment in self.apartments:
-            if not include_occupied and not apartment.is_available:
-                continue
-
-            if min_rent is not None and apartment.rent < min_rent:
-                continue
-            if max_rent is not None and apartment.rent > max_rent:
-                continue
-
-            if bedrooms is not None and apartment.bedrooms != bedrooms:
-                continue
-            if bathrooms is not None and apartment.bathrooms != bathrooms:
-                continue
-
-            if min_bedrooms is not None and apartment.bedrooms < min_bedrooms:
-                continue
-            if max_bedrooms is not None and apartment.bedrooms > max_bedrooms:
-                continue
-            if min_bathrooms is not None and apartment.bathrooms < min_bathrooms:
-                continue
-            if max_bathrooms is not None and apartment.bathrooms > max_bathrooms:
-                continue
-
-            results.append(apartment)
+    def _find_lease(self, unit_number):
+        apartment = self.find_apartment(unit_number)
+        return apartment.current_lease() if apartment else None
+
+    def _drop_leases(self, leases):
+        """Unlinks leases from their tenant, apartment and the manager, each in O(1)."""
+        leases = list(dict.fromkeys(leases))
+        if not leases:
+            return
+        for lease in leases:
+            lease.unlink()
+            self.lease_table.remove(lease.id)
+            self.lease_intervals.remove(lease)
+            self._invalidate_projection(lease.start_date, lease.end_date)
+            self.leases.remove(lease)
+            self.changes.record("lease", "delete", lease.apartment.unit_number, id=lease.id,
+                                tenant=lease.tenant.name)
+
+    def post_payments(self, payments):
+        from apartment_manager import bulk
+        return bulk.post_payments(self, payments)
+
+    def create_leases(self, leases):
+        from apartment_manager import bulk
+        return bulk.create_leases(self, leases)
+
+    def apply_fees(self, selection, fee, as_of=None):
+        from apartment_manager import bulk
+        return bulk.apply_fees(self, selection, fee, as_of)
 
+    def search_apartments(self, min_rent=None, max_rent=None, bedrooms=None, bathrooms=None, min_bedrooms=None, max_bedrooms=None, min_bathrooms=None, max_bathrooms=None, include_occupied=False):
+        results = self.find_apartments(min_rent, max_rent, bedrooms, bathrooms, min_bedrooms, max_bedrooms, min_bathrooms, max_bathrooms, include_occupied)
         if not results:
             return ["No apartments match the search criteria."]
-        
-        return [
-            f"Apartment {apartment.unit_number}: {apartment.bedrooms}BR/{apartment.bathrooms}BA, "
-            f"${apartment.rent}/month, Status: {'Available' if apartment.is_available else 'Occupied'}"
-            for apartment in results
-        ]
-
+        return [str(record) for record in results]
+
+    def find_apartments(self, *filters, **named_filters):
+        """Same filters as search_apartments, returning ApartmentRecord objects."""
+        return [ApartmentRecord.of(apartment) for apartment in self._filter_apartments(*filters, **named_filters)]
+
+    def _filter_apartments(self, min_rent=None, max_rent=None, bedrooms=None, bathrooms=None, min_bedrooms=None, max_bedrooms=None, min_bathrooms=None, max_bathrooms=None, include_occupied=False):
+        from apartment_manager import query as q
+
+        predicates = []
+        if not include_occupied:
+            predicates.append(q.available == True)
+        if min_rent is not None or max_rent is not None:
+            predicates.append(q.rent.between(min_rent, max_rent))
+        for field, exact, low, high in ((q.bedrooms, bedrooms, min_bedrooms, max_bedrooms),
+                                        (q.bathrooms, bathrooms, min_bathrooms, max_bathrooms)):
+            if exact is not None:
+                predicates.append(field == exact)
+            if low is not None or high is not None:
+                predicates.append(field.between(low, high))
+        return q.Query(*predicates).run(self)
+
+    def query(self, *predicates):
+        """Returns apartments matching every predicate built from apartment_manager.query fields."""
+        from apartment_manager.query import Query
+        return Query(*predicates).run(self)
+
+    def explain(self, *predicates):
+        from apartment_manager.query import Query
+        return Query(*predicates).explain(self)
 
     def list_apartments(self):
         return [str(a) for a in self.apartments]
@@ -157,10 +436,13 @@ class ApartmentManager:
 
     def calculate_total_annual_rent(self):
         return sum(apartment.calculate_annual_rent() for apartment in self.apartments)
+
+    def project_monthly_revenue(self, start_date, end_date):
+        """Returns (month, revenue) pairs expected from leases between the two dates."""
+        return self.projection.monthly_revenue(_to_date(start_date), _to_date(end_date))
+
     def generate_lease_summary(self, unit_number):
-        lease = next(
-            (l for l in self.leases if l.apartment.unit_number == unit_number), None
-        )
+        lease = self._find_lease(unit_number)
         if lease:
             payments_info = "\n".join(
                 [f"${p['amount']} on {p['date']}" for p in lease.payments]
@@ -177,30 +459,70 @@ class ApartmentManager:
             return summary
         return "No active lease found for the specified unit number."
 
+    def submit_maintenance_request(self, unit_number, request):
+        apartment = self.find_apartment(unit_number)
+        if apartment:
+            entry = {"request": request, "status": "Pending"}
+            entry["id"] = self.request_table.add(entry)
+            self.maintenance_stats.submitted(unit_number, entry, datetime.datetime.now())
+            apartment.add_maintenance_request(entry)
+            self.changes.record("maintenance", "add", unit_number, id=entry["id"], request=request, status="Pending")
+            return "Maintenance request submitted."
+        return "Apartment not found."
+
+    def update_maintenance_status(self, unit_number, index, status):
+        apartment = self.find_apartment(unit_number)
+        if apartment is None:
+            return "Apartment not found."
+        if not 0 <= index < len(apartment.maintenance_requests):
+            return "Maintenance request not found."
+        request = apartment.maintenance_requests[index]
+        apartment.update_request_status(index, status)
+        self.changes.record("maintenance", "update", unit_number, id=request.get("id"),
+                            request=request["request"], status=status)
+        return f"Request {index} for Unit {unit_number} marked {status}."
+
+    def maintenance_dashboard(self):
+        """SLA summary read straight from the running maintenance counters."""
+        stats = self.maintenance_stats
+        by_status = ", ".join(f"{status}: {count}" for status, count in stats.by_status.items() if count)
+        lines = [
+            f"Requests by status: {by_status or 'None'}",
+            f"Open backlog: {stats.open_backlog()}",
+            f"Time to assign: {stats.time_to_assign}",
+            f"Time to close: {stats.time_to_close}",
+        ]
+        for staff, counts in stats.by_staff.items():
+            open_count = sum(count for status, count in counts.items() if status not in CLOSED_STATUSES)
+            lines.append(f"Staff {staff}: {open_count} open, closed {stats.staff_time_to_close[staff]}")
+        return "\n".join(lines)
+
     def view_maintenance_requests(self, unit_number):
-        apartment = next(
-            (a for a in self.apartments if a.unit_number == unit_number), None
-        )
+        apartment = self.find_apartment(unit_number)
         if apartment:
             if apartment.maintenance_requests:
-                requests = "\n".join(apartment.maintenance_requests)
+                requests = "\n".join(
+                    req if isinstance(req, str) else f"{req['request']} (Status: {req['status']})"
+                    for req in apartment.maintenance_requests
+                )
                 return f"Maintenance Requests for Unit {unit_number}:\n{requests}"
             return f"No maintenance requests for Unit {unit_number}."
         return "Apartment not found."
     def generate_monthly_report(self, year, month):
+        return str(self.monthly_report(year, month))
+
+    def monthly_report(self, year, month):
         total_rent_collected = 0
         total_balance_due = 0
 
         for lease in self.leases:
             for payment in lease.payments:
-                payment_date = datetime.datetime.strptime(payment["date"], "%Y-%m-%d").date()
+                payment_date = _to_date(payment["date"])
                 if payment_date.year == year and payment_date.month == month:
                     total_rent_collected += payment["amount"]
             total_balance_due += lease.tenant.balance_due
 
-        return (f"Monthly Report for {month}/{year}\n"
-                f"Total Rent Collected: ${total_rent_collected}\n"
-                f"Total Outstanding Balances: ${total_balance_due}")
+        return MonthlyReport(year, month, total_rent_collected, total_balance_due)
 
     def filter_tenants_by_balance(self, threshold):
         filtered_tenants = [tenant for tenant in self.tenants if tenant.balance_due > threshold]
@@ -208,51 +530,93 @@ class ApartmentManager:
             return [str(tenant) for tenant in filtered_tenants]
         return "No tenants with balance above the specified threshold."
 
-    def apartment_occupancy_report(self):
+    def apartment_occupancy_report(self, as_of=None):
+        return str(self.occupancy(as_of))
+
+    def occupancy(self, as_of=None):
+        """Reports occupancy today, or on as_of, from the booking calendar."""
+        as_of = _to_date(as_of) if as_of is not None else None
         total_units = len(self.apartments)
-        occupied_units = len([apt for apt in self.apartments if not apt.is_available])
+        if as_of is None:
+            occupied_units = len([apt for apt in self.apartments if not apt.is_available])
+        else:
+            occupied_units = self.lease_intervals.active_count(as_of)
         occupancy_rate = (occupied_units / total_units) * 100 if total_units else 0
-        return (f"Total Apartments: {total_units}\n"
-                f"Occupied Apartments: {occupied_units}\n"
-                f"Occupancy Rate: {occupancy_rate:.2f}%")
+        return OccupancyReport(total_units, occupied_units, occupancy_rate, as_of)
+
+    def vacant_units(self, start_date, end_date):
+        """Returns unit numbers with no lease overlapping start_date..end_date."""
+        start, end = _to_date(start_date), _to_date(end_date)
+        return [apartment.unit_number for apartment in self.apartments
+                if self.lease_intervals.covering(apartment, start, end) is None]
 
     def view_tenant_profile(self, tenant_name):
-        tenant = next((t for t in self.tenants if t.name == tenant_name), None)
+        profile = self.tenant_profile(tenant_name)
+        return str(profile) if profile else "Tenant not found."
+
+    def tenant_profile(self, tenant_name):
+        """Returns a TenantProfile, or None if there is no such tenant."""
+        tenant = self.find_tenant(tenant_name)
         if tenant:
-            leases = [l for l in self.leases if l.tenant == tenant]
-            lease_info = "\n".join([str(l) for l in leases])
-            return (f"Profile for {tenant_name}:\n"
-                    f"Contact: {tenant.phone}, {tenant.email}\n"
-                    f"Balance Due: ${tenant.balance_due}\n"
-                    f"Leases:\n{lease_info}")
-        return "Tenant not found."
+            leases = tuple(LeaseRecord.of(lease) for lease in tenant.leases.values())
+            return TenantProfile(tenant.name, tenant.phone, tenant.email, tenant.balance_due, leases)
+        return None
 
     def assign_maintenance_staff(self, unit_number, staff_name):
-        apartment = next((a for a in self.apartments if a.unit_number == unit_number), None)
+        apartment = self.find_apartment(unit_number)
         if apartment:
             if apartment.maintenance_requests:
                 for request in apartment.maintenance_requests:
                     if request["status"] == "Pending":
-                        request["staff"] = staff_name
+                        self.maintenance_stats.assigned(unit_number, request, staff_name, datetime.datetime.now())
+                        self.changes.record("maintenance", "update", unit_number, id=request.get("id"),
+                                            request=request["request"], staff=staff_name)
                 return f"Staff {staff_name} assigned to pending requests for Unit {unit_number}."
             return f"No pending maintenance requests for Unit {unit_number}."
         return "Apartment not found."
 
 
-    def apply_late_fees(self, late_fee):
+    def apply_late_fees(self, late_fee, as_of=None):
+        """Charges late_fee, dated as_of (default today), to every tenant with a balance."""
+        charged_on = _to_date(as_of) if as_of else datetime.date.today()
         for tenant in self.tenants:
             if tenant.balance_due > 0:
                 tenant.balance_due += late_fee
+                self.aging.charge(tenant.id, late_fee, charged_on)
+                self.changes.record("tenant", "update", tenant.name, id=tenant.id, balance_due=tenant.balance_due)
         return f"Late fee of ${late_fee} applied to all tenants with outstanding balances."
 
     def extend_lease(self, unit_number, new_end_date):
-        lease = next((l for l in self.leases if l.apartment.unit_number == unit_number), None)
+        lease = self._find_lease(unit_number)
         if lease:
             old_end_date = lease.end_date
-            lease.end_date = datetime.datetime.strptime(new_end_date, "%Y-%m-%d").date()
+            end_date = _to_date(new_end_date)
+            if end_date < lease.start_date:
+                return (f"Cannot extend lease for Unit {unit_number}: "
+                        f"{end_date} is before the lease start {lease.start_date}.")
+            if end_date > old_end_date:
+                blocking = self.lease_intervals.covering(
+                    lease.apartment, old_end_date + datetime.timedelta(days=1), end_date
+                )
+                if blocking is not None:
+                    return (f"Cannot extend lease for Unit {unit_number}: "
+                            f"unit is booked from {blocking.start_date}.")
+            lease.end_date = end_date
+            self.lease_intervals.update(lease)
+            self._invalidate_projection(min(old_end_date, lease.end_date), max(old_end_date, lease.end_date))
+            self.changes.record("lease", "update", unit_number, id=lease.id, tenant=lease.tenant.name,
+                                end_date=lease.end_date)
             return (f"Lease for Unit {unit_number} extended from {old_end_date} to {lease.end_date}.")
         return "No active lease found for the specified unit."
 
+    def terminate_lease(self, unit_number):
+        lease = self._find_lease(unit_number)
+        if lease:
+            message = lease.terminate_lease()
+            self._drop_leases([lease])
+            return message
+        return "Lease not found."
+
     def track_maintenance_status(self):
         status_report = []
         for apartment in self.apartments:
@@ -271,6 +635,36 @@ class ApartmentManager:
         return "\n".join(overdue) if overdue else "No overdue leases found."
 
 
+    def reminder_notices(self, today=None, within_days=30, channel="email"):
+        """Yields notices for leases expiring within within_days, overdue leases and open balances."""
+        from apartment_manager.notifications import Notice
+
+        today = _to_date(today) if today else datetime.date.today()
+        address = (lambda tenant: tenant.email) if channel == "email" else (lambda tenant: tenant.phone)
+        expiring = self.lease_intervals.ending_between(today, today + datetime.timedelta(days=within_days))
+        for lease in expiring:
+            unit = lease.apartment.unit_number
+            yield Notice(lease.tenant.id, lease.tenant.name, address(lease.tenant), channel, "lease_expiring",
+                         (unit, lease.end_date), f"Lease for Unit {unit} ends on {lease.end_date}.")
+        for lease in self.lease_intervals.ending_between(None, today - datetime.timedelta(days=1)):
+            unit = lease.apartment.unit_number
+            yield Notice(lease.tenant.id, lease.tenant.name, address(lease.tenant), channel, "lease_overdue",
+                         (unit, lease.end_date), f"Lease for Unit {unit} ended on {lease.end_date}.")
+        for tenant in self.tenants:
+            if tenant.balance_due > 0:
+                yield Notice(tenant.id, tenant.name, address(tenant), channel, "balance_due",
+                             tenant.balance_due, f"{tenant.name} owes ${tenant.balance_due}")
+
+    def send_reminders(self, sink, today=None, within_days=30, channel="email", workers=4):
+        from apartment_manager.notifications import NotificationPipeline
+
+        with NotificationPipeline(sink, workers=workers) as pipeline:
+            pipeline.submit(self.reminder_notices(today, within_days, channel))
+        if pipeline.failures:
+            return (f"{pipeline.delivered} reminder(s) delivered, "
+                    f"{len(pipeline.failures)} batch(es) failed.")
+        return f"{pipeline.delivered} reminder(s) delivered."
+
     def generate_outstanding_report(self):
         report = []
         for tenant in self.tenants:
@@ -278,17 +672,80 @@ class ApartmentManager:
                 report.append(f"{tenant.name}: ${tenant.balance_due}")
         return "\n".join(report) if report else "No outstanding balances found."
 
+    def delinquency_report(self, as_of=None):
+        """Ages every open balance into 0-30/31-60/61-90/90+ day buckets as of the given date."""
+        as_of = _to_date(as_of) if as_of else datetime.date.today()
+        rows = self.aging.report(as_of)
+        if not rows:
+            return "No outstanding balances found."
+        lines = [f"Aging as of {as_of}"]
+        for row in rows:
+            buckets = ", ".join(f"{name}: ${row.buckets[name]}" for name in BUCKETS)
+            lines.append(f"{self.tenant_table.get(row.tenant).name}: {buckets}, Total: ${row.total}")
+        totals = self.aging.buckets(as_of)
+        lines.append("All tenants: " + ", ".join(f"{name}: ${totals[name]}" for name in BUCKETS)
+                     + f", Total: ${sum(totals.values())}")
+        return "\n".join(lines)
+
     def calculate_average_rent(self):
-        total_rent = sum(apartment.rent for apartment in self.apartments)
-        average_rent = total_rent / len(self.apartments) if self.apartments else 0
-        return f"The average rent of all apartments is ${average_rent:.2f}."
+        return f"The average rent of all apartments is ${self.average_rent():.2f}."
 
-    def delete_apartment(self, unit_number):
-        apartment = next((a for a in self.apartments if a.unit_number == unit_number), None)
-        if apartment:
+    def average_rent(self):
+        total_rent = sum(apartment.rent for apartment in self.apartments)
+        return total_rent / len(self.apartments) if self.apartments else 0
+
+    def delete_apartment(self, unit_number, on_delete="cascade"):
+        if self.find_apartment(unit_number) is None:
+            return "Apartment not found."
+        try:
+            self.delete_apartments([unit_number], on_delete)
+        except ValueError as e:
+            return str(e)
+        return f"Apartment Unit {unit_number} deleted."
+
+    def delete_apartments(self, unit_numbers, on_delete="cascade"):
+        """Deletes the given units along with their leases and maintenance requests.
+
+        With on_delete="reject" nothing is deleted if any unit still has a lease.
+        """
+        apartments = self._resolve_for_delete(unit_numbers, self.find_apartment, "Apartment", on_delete)
+        self._drop_leases([lease for apartment in apartments for lease in apartment.leases.values()])
+        for apartment in apartments:
+            self._apartments_by_unit[self.unit_keys.get(apartment.unit_number)].remove(apartment)
+            self.apartment_table.remove(apartment.id)
+            for request in apartment.maintenance_requests:
+                if isinstance(request, dict):
+                    self.maintenance_stats.removed(apartment.unit_number, request)
+                    self.request_table.remove(request.get("id"))
+            apartment.maintenance_requests.clear()
+            if self._apartment_index is not None:
+                self._apartment_index.remove(apartment)
             self.apartments.remove(apartment)
-            return f"Apartment Unit {unit_number} deleted."
-        return "Apartment not found."
+            self.changes.record("apartment", "delete", apartment.unit_number, id=apartment.id)
+        return [apartment.unit_number for apartment in apartments]
+
+    def _resolve_for_delete(self, keys, find, label, on_delete):
+        if on_delete not in ("cascade", "reject"):
+            raise ValueError(f"Unknown on_delete policy {on_delete!r}.")
+        entities = {}
+        for key in keys:
+            entity = find(key)
+            if entity is None:
+                raise ValueError(f"{label} {key} not found.")
+            if on_delete == "reject" and entity.leases:
+                raise ValueError(f"{label} {key} has active leases.")
+            entities[entity] = None
+        return list(entities)
+
+    def export_changes(self, stream, since=0):
+        """Streams changes after sequence number since to stream as JSON lines."""
+        return self.changes.write_jsonl(stream, since)
+
+    def export_report(self, dataset, path, fmt="csv", compress=False):
+        """Streams leases, payments or tenants to path as csv, jsonl or columnar, optionally gzipped."""
+        from apartment_manager import export
+        rows = export.export(self, dataset, path, fmt, compress)
+        return f"Exported {rows} {dataset} row(s) to {path}."
 
     def get_maintenance_summary(self):
         """Provides a summary of all maintenance requests."""
@@ -302,9 +759,26 @@ class ApartmentManager:
         return "\n".join(summary) if summary else "No maintenance requests found."
 
 
-    def delete_tenant(self, tenant_name):
-        tenant = next((t for t in self.tenants if t.name == tenant_name), None)
-        if tenant:
+    def delete_tenant(self, tenant_name, on_delete="cascade"):
+        if self.find_tenant(tenant_name) is None:
+            return "Tenant not found."
+        try:
+            self.delete_tenants([tenant_name], on_delete)
+        except ValueError as e:
+            return str(e)
+        return f"Tenant {tenant_name} deleted."
+
+    def delete_tenants(self, tenant_names, on_delete="cascade"):
+        """Deletes the given tenants along with their leases, freeing the units they held.
+
+        With on_delete="reject" nothing is deleted if any tenant still has a lease.
+        """
+        tenants = self._resolve_for_delete(tenant_names, self.find_tenant, "Tenant", on_delete)
+        self._drop_leases([lease for tenant in tenants for lease in tenant.leases.values()])
+        for tenant in tenants:
+            self.tenant_index.remove(tenant)
+            self.tenant_table.remove(tenant.id)
+            self.aging.remove_tenant(tenant.id)
             self.tenants.remove(tenant)
-            return f"Tenant {tenant_name} deleted."
-        return "Tenant not found."
\ No newline at end of file
+            self.changes.record("tenant", "delete", tenant.name, id=tenant.id)
+        return [tenant.name for tenant in tenants]
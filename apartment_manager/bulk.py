@@ -0,0 +1,116 @@
+import collections
+import datetime
+
+from apartment_manager.apartment_manager import _to_date
+
+PaymentResult = collections.namedtuple("PaymentResult", "tenant amount date balance_due")
+LeaseResult = collections.namedtuple("LeaseResult", "tenant unit_number start_date end_date balance_due")
+FeeResult = collections.namedtuple("FeeResult", "tenant fee balance_due")
+
+
+class BulkOperationError(ValueError):
+    """Raised when any item of a bulk operation is invalid; nothing has been applied."""
+
+    def __init__(self, errors):
+        self.errors = errors
+        super().__init__(
+            f"{len(errors)} invalid item(s): "
+            + "; ".join(f"#{position}: {message}" for position, message in errors[:5])
+        )
+
+
+def post_payments(manager, payments):
+    """Applies (tenant_name, amount[, date]) payments all at once, or none of them."""
+    today = datetime.date.today()
+    errors = []
+    resolved = []
+    for position, item in enumerate(payments):
+        tenant_name, amount = item[0], item[1]
+        tenant = manager.find_tenant(tenant_name)
+        if tenant is None:
+            errors.append((position, f"tenant {tenant_name!r} not found"))
+            continue
+        if not isinstance(amount, (int, float)) or amount <= 0:
+            errors.append((position, f"invalid amount {amount!r}"))
+            continue
+        try:
+            date = _to_date(item[2]) if len(item) > 2 else today
+        except ValueError:
+            errors.append((position, f"invalid date {item[2]!r}"))
+            continue
+        resolved.append((tenant, amount, date))
+    if errors:
+        raise BulkOperationError(errors)
+
+    results = []
+    for tenant, amount, date in resolved:
+        tenant.make_payment(amount, date)
+        results.append(PaymentResult(tenant.name, amount, date, tenant.balance_due))
+    return results
+
+
+def create_leases(manager, leases):
+    """Creates (tenant_name, unit_number, start_date, end_date) leases all at once, or none of them."""
+    errors = []
+    resolved = []
+    claimed = {}
+    for position, (tenant_name, unit_number, start_date, end_date) in enumerate(leases):
+        tenant = manager.find_tenant(tenant_name)
+        apartment = manager.find_apartment(unit_number)
+        if tenant is None:
+            errors.append((position, f"tenant {tenant_name!r} not found"))
+            continue
+        if apartment is None:
+            errors.append((position, f"unit {unit_number!r} not found"))
+            continue
+        try:
+            start, end = _to_date(start_date), _to_date(end_date)
+        except ValueError:
+            errors.append((position, f"invalid dates {start_date!r} to {end_date!r}"))
+            continue
+        if start > end:
+            errors.append((position, "lease ends before it starts"))
+            continue
+        booked = claimed.setdefault(apartment.id, [])
+        if (manager.lease_intervals.covering(apartment, start, end) is not None
+                or any(start <= other_end and other_start <= end for other_start, other_end in booked)):
+            errors.append((position, f"unit {unit_number!r} not available"))
+            continue
+        booked.append((start, end))
+        resolved.append((tenant, apartment, start, end))
+    if errors:
+        raise BulkOperationError(errors)
+
+    results = []
+    for tenant, apartment, start, end in resolved:
+        manager._open_lease(tenant, apartment, start, end)
+        results.append(LeaseResult(tenant.name, apartment.unit_number, start, end, tenant.balance_due))
+    return results
+
+
+def apply_fees(manager, selection, fee, as_of=None):
+    """Adds fee, charged on as_of (default today), to every named tenant's balance, or to none of them."""
+    errors = []
+    resolved = []
+    if not isinstance(fee, (int, float)) or fee <= 0:
+        raise BulkOperationError([(None, f"invalid fee {fee!r}")])
+    for position, tenant_name in enumerate(selection):
+        tenant = manager.find_tenant(tenant_name)
+        if tenant is None:
+            errors.append((position, f"tenant {tenant_name!r} not found"))
+            continue
+        resolved.append(tenant)
+    try:
+        charged_on = _to_date(as_of) if as_of is not None else datetime.date.today()
+    except ValueError:
+        errors.append((None, f"invalid date {as_of!r}"))
+    if errors:
+        raise BulkOperationError(errors)
+
+    results = []
+    for tenant in resolved:
+        tenant.balance_due += fee
+        manager.aging.charge(tenant.id, fee, charged_on)
+        manager.changes.record("tenant", "update", tenant.name, id=tenant.id, balance_due=tenant.balance_due)
+        results.append(FeeResult(tenant.name, fee, tenant.balance_due))
+    return results
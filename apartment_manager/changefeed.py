@@ -0,0 +1,42 @@
+import collections
+
+Change = collections.namedtuple("Change", "seq entity op key data")
+
+
+class ChangeFeed:
+    """Append-only, sequence-numbered log of manager mutations."""
+
+    def __init__(self):
+        self._changes = []
+        self._first_seq = 1
+
+    @property
+    def last_seq(self):
+        return self._first_seq + len(self._changes) - 1
+
+    def record(self, entity, op, key, **data):
+        change = Change(self.last_seq + 1, entity, op, key, data)
+        self._changes.append(change)
+        return change.seq
+
+    def since(self, seq):
+        """Returns the changes numbered after seq, without touching older entries."""
+        if seq < self._first_seq - 1:
+            raise ValueError(f"Changes up to {self._first_seq - 1} are no longer retained.")
+        return self._changes[seq - self._first_seq + 1:]
+
+    def discard_through(self, seq):
+        """Drops retained changes up to and including seq once every consumer has them."""
+        count = min(max(seq - self._first_seq + 1, 0), len(self._changes))
+        del self._changes[:count]
+        self._first_seq += count
+
+    def write_jsonl(self, stream, since=0):
+        """Writes the changes after since to stream as JSON lines and returns the last seq written."""
+        import json
+
+        last = since
+        for change in self.since(since):
+            stream.write(json.dumps(change._asdict(), default=str) + "\n")
+            last = change.seq
+        return last
@@ -0,0 +1,478 @@
+"""Differential testing of ApartmentManager against a naive reference model.
+
+Each seed generates a random sequence of operations (adds, leases, payments,
+fees, extensions, deletes, searches and reports) and applies it step by step
+to both the Reference model, which keeps plain lists and answers everything
+with linear scans, and the real manager with its indexes and caches. The
+answers are compared after every step and each side is timed per operation.
+Seeds run in parallel worker processes:
+
+    python -m apartment_manager.differential --seeds 16 --steps 2000
+"""
+import argparse
+import collections
+import concurrent.futures
+import datetime
+import functools
+import random
+import sys
+import time
+
+from apartment_manager.aging import BUCKETS, bucket_for
+from apartment_manager.apartment_manager import ApartmentManager
+from apartment_manager.tenant_index import normalize_name
+
+BASE_DATE = datetime.date(2024, 1, 1)
+HORIZON_DAYS = 3 * 365
+
+OperationTimes = collections.namedtuple("OperationTimes", "calls reference optimized")
+Mismatch = collections.namedtuple("Mismatch", "step operation expected actual")
+RunResult = collections.namedtuple("RunResult", "seed steps mismatch timings")
+
+# Relative frequency of each randomly generated operation.
+OPERATION_WEIGHTS = (
+    ("add_apartment", 4), ("add_tenant", 4), ("lease", 12), ("lease_batch", 3),
+    ("pay", 8), ("fee", 3), ("late_fees", 1), ("set_rent", 2), ("extend", 4),
+    ("terminate", 2), ("delete_apartment", 1), ("delete_tenant", 1),
+    ("search", 6), ("tenant_search", 3), ("occupancy", 4), ("vacant", 3),
+    ("bookings", 3), ("aging", 2), ("revenue", 2), ("balances", 2),
+)
+
+
+def _month_index(day):
+    return day.year * 12 + day.month - 1
+
+
+def _month_start(index):
+    return datetime.date(index // 12, index % 12 + 1, 1)
+
+
+def generate_operations(rng, steps, units=40, tenants=60):
+    """Returns operation tuples: half the unit and tenant pools up front, then steps random operations."""
+    unit_pool = [str(100 + i) for i in range(units)]
+    name_pool = [f"Tenant {i}" for i in range(tenants)]
+
+    def day():
+        return BASE_DATE + datetime.timedelta(days=rng.randrange(HORIZON_DAYS))
+
+    def window(max_days=400):
+        start = day()
+        return start, start + datetime.timedelta(days=rng.randrange(max_days))
+
+    def lease_dates():
+        start, end = window()
+        return (end, start) if rng.random() < 0.05 else (start, end)
+
+    def apartment(unit):
+        return ("add_apartment", unit, rng.randint(1, 4), rng.randint(1, 3), rng.randrange(800, 3000, 50))
+
+    def tenant(name):
+        number = rng.randrange(10 ** 9)
+        return ("add_tenant", name, f"555{number:09d}", f"t{number}@example.com")
+
+    operations = [apartment(unit) for unit in unit_pool[:units // 2]]
+    operations += [tenant(name) for name in name_pool[:tenants // 2]]
+    kinds, weights = zip(*OPERATION_WEIGHTS)
+    for kind in rng.choices(kinds, weights, k=steps):
+        unit, name = rng.choice(unit_pool), rng.choice(name_pool)
+        if kind == "add_apartment":
+            operations.append(apartment(unit))
+        elif kind == "add_tenant":
+            operations.append(tenant(name))
+        elif kind == "lease":
+            operations.append(("lease", name, unit) + lease_dates())
+        elif kind == "lease_batch":
+            batch = [(rng.choice(name_pool), rng.choice(unit_pool)) + lease_dates() for _ in range(rng.randint(1, 4))]
+            operations.append(("lease_batch", batch))
+        elif kind == "pay":
+            operations.append(("pay", name, rng.randrange(50, 2000, 50)))
+        elif kind == "fee":
+            operations.append(("fee", rng.sample(name_pool, rng.randint(1, 3)), rng.randrange(10, 100, 5)))
+        elif kind == "late_fees":
+            operations.append(("late_fees", rng.randrange(10, 100, 5)))
+        elif kind == "set_rent":
+            operations.append(("set_rent", unit, rng.randrange(800, 3000, 50)))
+        elif kind == "extend":
+            operations.append(("extend", unit, day()))
+        elif kind in ("terminate", "delete_apartment", "bookings"):
+            operations.append((kind, unit))
+        elif kind == "delete_tenant":
+            operations.append(("delete_tenant", name))
+        elif kind == "search":
+            low = rng.choice((None, rng.randrange(800, 2000, 50)))
+            high = rng.choice((None, rng.randrange(1500, 3000, 50)))
+            operations.append(("search", low, high, rng.choice((None, 1, 2, 3)), rng.random() < 0.3))
+        elif kind == "tenant_search":
+            operations.append(("tenant_search", name[:rng.randint(0, len(name))].lower()))
+        elif kind in ("occupancy", "aging"):
+            operations.append((kind, day()))
+        elif kind in ("vacant", "revenue"):
+            operations.append((kind,) + window())
+        else:
+            operations.append((kind,))
+    return operations
+
+
+class Reference:
+    """The specification: plain lists of dicts, every answer computed by a linear scan."""
+
+    def __init__(self):
+        self.apartments = []
+        self.tenants = []
+        self.leases = []
+        self._next_tenant_id = 0
+
+    def _apartment(self, unit):
+        return next((a for a in self.apartments if a["unit"] == unit), None)
+
+    def _tenant(self, name):
+        return next((t for t in self.tenants if t["name"] == name), None)
+
+    def _leases_on(self, apartment):
+        return [lease for lease in self.leases if lease["apartment"] is apartment]
+
+    def _overlapping(self, apartment, start, end):
+        return [l for l in self._leases_on(apartment) if l["start"] <= end and start <= l["end"]]
+
+    def _current_lease(self, apartment):
+        leases = self._leases_on(apartment) if apartment else []
+        if not leases:
+            return None
+        today = datetime.date.today()
+        upcoming = [l for l in leases if l["start"] > today]
+        return (next((l for l in leases if l["start"] <= today <= l["end"]), None)
+                or min(upcoming, key=lambda l: l["start"], default=None)
+                or max(leases, key=lambda l: l["end"]))
+
+    def _open_charges(self, tenant, as_of=None):
+        paid = sum(amount for date, amount in tenant["payments"] if as_of is None or date <= as_of)
+        charges = []
+        for date, amount in sorted(tenant["charges"]):
+            if as_of is None or date <= as_of:
+                applied = min(paid, amount)
+                paid -= applied
+                if amount > applied:
+                    charges.append((date, amount - applied))
+        return charges
+
+    def _open_lease(self, tenant, apartment, start, end):
+        self.leases.append({"tenant": tenant, "apartment": apartment, "start": start, "end": end})
+        tenant["balance"] += apartment["rent"]
+        tenant["charges"].append((start, apartment["rent"]))
+
+    def add_apartment(self, unit, bedrooms, bathrooms, rent):
+        self.apartments.append({"unit": unit, "bedrooms": bedrooms, "bathrooms": bathrooms, "rent": rent})
+
+    def add_tenant(self, name, phone, email):
+        self.tenants.append({"id": self._next_tenant_id, "name": name, "balance": 0, "charges": [], "payments": []})
+        self._next_tenant_id += 1
+
+    def lease(self, name, unit, start, end):
+        tenant, apartment = self._tenant(name), self._apartment(unit)
+        if not tenant or not apartment or start > end or self._overlapping(apartment, start, end):
+            return False
+        self._open_lease(tenant, apartment, start, end)
+        return True
+
+    def lease_batch(self, leases):
+        resolved = []
+        for name, unit, start, end in leases:
+            tenant, apartment = self._tenant(name), self._apartment(unit)
+            if not tenant or not apartment or start > end or self._overlapping(apartment, start, end):
+                return False
+            if any(a is apartment and s <= end and start <= e for _, a, s, e in resolved):
+                return False
+            resolved.append((tenant, apartment, start, end))
+        for lease in resolved:
+            self._open_lease(*lease)
+        return True
+
+    def pay(self, name, amount):
+        tenant = self._tenant(name)
+        if tenant is None:
+            return None
+        tenant["balance"] -= amount
+        tenant["payments"].append((datetime.date.today(), amount))
+        return tenant["balance"]
+
+    def fee(self, names, fee):
+        tenants = [self._tenant(name) for name in names]
+        if None in tenants:
+            return False
+        for tenant in tenants:
+            tenant["balance"] += fee
+            tenant["charges"].append((datetime.date.today(), fee))
+        return True
+
+    def late_fees(self, fee):
+        for tenant in self.tenants:
+            if tenant["balance"] > 0:
+                tenant["balance"] += fee
+                tenant["charges"].append((datetime.date.today(), fee))
+
+    def set_rent(self, unit, rent):
+        apartment = self._apartment(unit)
+        if apartment is None:
+            return False
+        apartment["rent"] = rent
+        return True
+
+    def extend(self, unit, new_end):
+        lease = self._current_lease(self._apartment(unit))
+        if lease is None:
+            return "none"
+        if new_end < lease["start"]:
+            return "blocked"
+        if new_end > lease["end"]:
+            window = (lease["end"] + datetime.timedelta(days=1), new_end)
+            if [other for other in self._overlapping(lease["apartment"], *window) if other is not lease]:
+                return "blocked"
+        lease["end"] = new_end
+        return "extended"
+
+    def terminate(self, unit):
+        lease = self._current_lease(self._apartment(unit))
+        if lease is None:
+            return False
+        self.leases.remove(lease)
+        return True
+
+    def delete_apartment(self, unit):
+        apartment = self._apartment(unit)
+        if apartment is None:
+            return False
+        self.leases = [lease for lease in self.leases if lease["apartment"] is not apartment]
+        self.apartments.remove(apartment)
+        return True
+
+    def delete_tenant(self, name):
+        tenant = self._tenant(name)
+        if tenant is None:
+            return False
+        self.leases = [lease for lease in self.leases if lease["tenant"] is not tenant]
+        self.tenants.remove(tenant)
+        return True
+
+    def search(self, min_rent, max_rent, min_bedrooms, include_occupied):
+        results = []
+        today = datetime.date.today()
+        for a in self.apartments:
+            available = not self._overlapping(a, today, today)
+            if ((include_occupied or available)
+                    and (min_rent is None or a["rent"] >= min_rent)
+                    and (max_rent is None or a["rent"] <= max_rent)
+                    and (min_bedrooms is None or a["bedrooms"] >= min_bedrooms)):
+                results.append((a["unit"], a["bedrooms"], a["bathrooms"], a["rent"], available))
+        return results
+
+    def tenant_search(self, prefix):
+        prefix = normalize_name(prefix)
+        matches = sorted((normalize_name(t["name"]), t["id"], t["name"]) for t in self.tenants)
+        return [(tenant_id, name) for key, tenant_id, name in matches if key.startswith(prefix)][:20]
+
+    def occupancy(self, as_of):
+        return sum(1 for lease in self.leases if lease["start"] <= as_of <= lease["end"])
+
+    def vacant(self, start, end):
+        return [a["unit"] for a in self.apartments if not self._overlapping(a, start, end)]
+
+    def bookings(self, unit):
+        apartment = self._apartment(unit)
+        leases = sorted(self._leases_on(apartment), key=lambda lease: lease["start"]) if apartment else []
+        return [(lease["start"], lease["end"]) for lease in leases]
+
+    def aging(self, as_of):
+        totals = dict.fromkeys(BUCKETS, 0)
+        outstanding = []
+        for tenant in self.tenants:
+            for date, amount in self._open_charges(tenant, as_of):
+                totals[bucket_for((as_of - date).days)] += amount
+            charges = self._open_charges(tenant)
+            if charges:
+                outstanding.append((tenant["id"], sum(amount for _, amount in charges)))
+        return totals, sorted(outstanding)
+
+    def revenue(self, start, end):
+        revenue = []
+        for index in range(_month_index(start), _month_index(end) + 1):
+            first, last = _month_start(index), _month_start(index + 1) - datetime.timedelta(days=1)
+            total = 0
+            for lease in self.leases:
+                days = (min(lease["end"], last) - max(lease["start"], first)).days + 1
+                if days > 0:
+                    total += lease["apartment"]["rent"] * days / ((last - first).days + 1)
+            revenue.append((first, round(total, 2)))
+        return revenue
+
+    def balances(self):
+        return [(t["id"], t["name"], t["balance"]) for t in self.tenants]
+
+
+class Indexed:
+    """Drives a real ApartmentManager and normalizes its answers to the Reference shapes."""
+
+    def __init__(self, factory=ApartmentManager):
+        self.manager = factory()
+
+    def add_apartment(self, unit, bedrooms, bathrooms, rent):
+        self.manager.add_apartment(unit, bedrooms, bathrooms, rent)
+
+    def add_tenant(self, name, phone, email):
+        self.manager.add_tenant(name, phone, email)
+
+    def lease(self, name, unit, start, end):
+        try:
+            self.manager.lease_apartment(name, unit, start, end)
+        except ValueError:
+            return False
+        return True
+
+    def lease_batch(self, leases):
+        try:
+            self.manager.create_leases(leases)
+        except ValueError:
+            return False
+        return True
+
+    def pay(self, name, amount):
+        if self.manager.make_payment(name, amount) == "Tenant not found.":
+            return None
+        return self.manager.find_tenant(name).balance_due
+
+    def fee(self, names, fee):
+        try:
+            self.manager.apply_fees(names, fee)
+        except ValueError:
+            return False
+        return True
+
+    def late_fees(self, fee):
+        self.manager.apply_late_fees(fee)
+
+    def set_rent(self, unit, rent):
+        return self.manager.set_rent(unit, rent) != "Apartment not found."
+
+    def extend(self, unit, new_end):
+        message = self.manager.extend_lease(unit, new_end)
+        if message.startswith("Cannot extend"):
+            return "blocked"
+        return "extended" if message.startswith("Lease for") else "none"
+
+    def terminate(self, unit):
+        return self.manager.terminate_lease(unit) != "Lease not found."
+
+    def delete_apartment(self, unit):
+        return self.manager.delete_apartment(unit) != "Apartment not found."
+
+    def delete_tenant(self, name):
+        return self.manager.delete_tenant(name) != "Tenant not found."
+
+    def search(self, min_rent, max_rent, min_bedrooms, include_occupied):
+        records = self.manager.find_apartments(min_rent=min_rent, max_rent=max_rent, min_bedrooms=min_bedrooms,
+                                               include_occupied=include_occupied)
+        return [tuple(record) for record in records]
+
+    def tenant_search(self, prefix):
+        return [(tenant.id, tenant.name) for tenant in self.manager.search_tenants(prefix=prefix)]
+
+    def occupancy(self, as_of):
+        return self.manager.occupancy(as_of).occupied_units
+
+    def vacant(self, start, end):
+        return self.manager.vacant_units(start, end)
+
+    def bookings(self, unit):
+        return [(lease.start_date, lease.end_date) for lease in self.manager.bookings(unit)]
+
+    def aging(self, as_of):
+        ledger = self.manager.aging
+        outstanding = [(t.id, ledger.outstanding(t.id)) for t in self.manager.tenants]
+        return ledger.buckets(as_of), sorted(entry for entry in outstanding if entry[1])
+
+    def revenue(self, start, end):
+        return self.manager.project_monthly_revenue(start, end)
+
+    def balances(self):
+        return [(t.id, t.name, t.balance_due) for t in self.manager.tenants]
+
+
+def _same(expected, actual):
+    # Revenue is prorated in a different order on each side, so floats may differ by rounding.
+    if isinstance(expected, float) or isinstance(actual, float):
+        return abs(expected - actual) <= 0.05
+    if isinstance(expected, (list, tuple)) and isinstance(actual, (list, tuple)):
+        return len(expected) == len(actual) and all(map(_same, expected, actual))
+    if isinstance(expected, dict) and isinstance(actual, dict):
+        return expected.keys() == actual.keys() and all(_same(expected[k], actual[k]) for k in expected)
+    return expected == actual
+
+
+def run_seed(seed, steps=500, units=40, tenants=60, factory=ApartmentManager):
+    """Replays one seed's operations on both sides; stops at the first differing answer."""
+    operations = generate_operations(random.Random(seed), steps, units, tenants)
+    reference, indexed = Reference(), Indexed(factory)
+    timings = {}
+    for step, (kind, *args) in enumerate(operations):
+        start = time.perf_counter()
+        expected = getattr(reference, kind)(*args)
+        middle = time.perf_counter()
+        actual = getattr(indexed, kind)(*args)
+        end = time.perf_counter()
+        calls, reference_seconds, optimized_seconds = timings.get(kind, (0, 0.0, 0.0))
+        timings[kind] = OperationTimes(calls + 1, reference_seconds + middle - start, optimized_seconds + end - middle)
+        if not _same(expected, actual):
+            return RunResult(seed, step + 1, Mismatch(step, (kind, *args), expected, actual), timings)
+    return RunResult(seed, len(operations), None, timings)
+
+
+def run_seeds(seeds, steps=500, units=40, tenants=60, processes=None, factory=ApartmentManager):
+    """Runs seeds in a process pool; processes=1 runs them in this process."""
+    run = functools.partial(run_seed, steps=steps, units=units, tenants=tenants, factory=factory)
+    if processes == 1:
+        return [run(seed) for seed in seeds]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=processes) as pool:
+        return list(pool.map(run, seeds))
+
+
+def format_report(results):
+    lines = []
+    for result in results:
+        if result.mismatch:
+            mismatch = result.mismatch
+            lines.append(f"Seed {result.seed}: MISMATCH at step {mismatch.step} {mismatch.operation!r}\n"
+                         f"  expected {mismatch.expected!r}\n  actual   {mismatch.actual!r}")
+    passed = sum(1 for result in results if result.mismatch is None)
+    lines.append(f"{passed}/{len(results)} seed(s) matched the reference "
+                 f"({sum(result.steps for result in results)} steps)")
+
+    totals = {}
+    for result in results:
+        for kind, times in result.timings.items():
+            calls, reference, optimized = totals.get(kind, (0, 0.0, 0.0))
+            totals[kind] = OperationTimes(calls + times.calls, reference + times.reference, optimized + times.optimized)
+    lines.append(f"{'operation':<18} {'calls':>8} {'reference ms':>14} {'optimized ms':>14} {'speedup':>8}")
+    for kind, times in sorted(totals.items()):
+        speedup = times.reference / times.optimized if times.optimized else 0
+        lines.append(f"{kind:<18} {times.calls:>8} {times.reference * 1000:>14.2f} "
+                     f"{times.optimized * 1000:>14.2f} {speedup:>7.1f}x")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare ApartmentManager against a naive reference model.")
+    parser.add_argument("--seeds", type=int, default=8)
+    parser.add_argument("--first-seed", type=int, default=0)
+    parser.add_argument("--steps", type=int, default=1000)
+    parser.add_argument("--units", type=int, default=40)
+    parser.add_argument("--tenants", type=int, default=60)
+    parser.add_argument("--processes", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    seeds = range(args.first_seed, args.first_seed + args.seeds)
+    results = run_seeds(seeds, args.steps, args.units, args.tenants, args.processes)
+    print(format_report(results))
+    return 0 if all(result.mismatch is None for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,210 @@
+"""Streaming export of manager data to CSV, JSON lines or a simple columnar format.
+
+Rows are generated lazily from the manager and handed to a background writer
+thread in fixed-size chunks through a bounded queue. At most
+chunk_rows * (max_chunks + 2) rows are held in memory, whatever the export size.
+
+The columnar format is, after the MAGIC line, one JSON header line listing the
+column names, then one block per chunk: a uint32 row count followed, for each
+column, by a uint32 byte length and the column's values as UTF-8 text separated
+by NUL bytes (an empty value stands for None).
+"""
+import io
+import struct
+
+from apartment_manager.workers import WorkerPool
+
+MAGIC = b"AMCOL1\n"
+FORMATS = ("csv", "jsonl", "columnar")
+
+_UINT32 = struct.Struct("<I")
+
+
+def lease_rows(manager):
+    for lease in manager.leases:
+        paid = sum(payment["amount"] for payment in lease.payments)
+        yield (lease.id, lease.tenant.name, lease.apartment.unit_number,
+               lease.start_date, lease.end_date, len(lease.payments), paid)
+
+
+def payment_rows(manager):
+    """One row per payment: tenant payments first, then payments recorded against a lease.
+
+    Histories not loaded yet are streamed from their loader and left unloaded,
+    so an export does not pull every tenant's payments into memory for good.
+    """
+    from apartment_manager.lazy import iter_uncached
+
+    for tenant in manager.tenants:
+        for payment in iter_uncached(tenant, "payment_history"):
+            yield (tenant.id, tenant.name, None, payment["amount"], payment["date"])
+    for lease in manager.leases:
+        for payment in lease.payments:
+            yield (lease.tenant.id, lease.tenant.name, lease.id, payment["amount"], payment["date"])
+
+
+def tenant_rows(manager):
+    for tenant in manager.tenants:
+        yield (tenant.id, tenant.name, tenant.phone, tenant.email, tenant.balance_due)
+
+
+DATASETS = {
+    "leases": (("lease_id", "tenant", "unit_number", "start_date", "end_date", "payments", "paid"), lease_rows),
+    "payments": (("tenant_id", "tenant", "lease_id", "amount", "date"), payment_rows),
+    "tenants": (("tenant_id", "name", "phone", "email", "balance_due"), tenant_rows),
+}
+
+
+def _text(value):
+    return "" if value is None else str(value)
+
+
+class CSVWriter:
+    def __init__(self, stream, columns):
+        import csv
+
+        self._stream = stream
+        self._buffer = io.StringIO()
+        self._csv = csv.writer(self._buffer)
+        self._csv.writerow(columns)
+
+    def write_chunk(self, rows):
+        # Format the whole chunk in memory so the stream sees one large write.
+        self._csv.writerows(rows)
+        self.close()
+
+    def close(self):
+        self._stream.write(self._buffer.getvalue().encode())
+        self._buffer.seek(0)
+        self._buffer.truncate()
+
+
+class JSONLWriter:
+    def __init__(self, stream, columns):
+        import json
+
+        self._stream = stream
+        self._columns = columns
+        self._encode = json.JSONEncoder(default=str).encode
+
+    def write_chunk(self, rows):
+        columns, encode = self._columns, self._encode
+        self._stream.write("".join(encode(dict(zip(columns, row))) + "\n" for row in rows).encode())
+
+    def close(self):
+        pass
+
+
+class ColumnarWriter:
+    def __init__(self, stream, columns):
+        import json
+
+        self._stream = stream
+        stream.write(MAGIC + json.dumps(list(columns)).encode() + b"\n")
+
+    def write_chunk(self, rows):
+        parts = [_UINT32.pack(len(rows))]
+        for values in zip(*rows):
+            block = "\0".join(map(_text, values)).encode()
+            parts.append(_UINT32.pack(len(block)))
+            parts.append(block)
+        self._stream.write(b"".join(parts))
+
+    def close(self):
+        pass
+
+
+WRITERS = {"csv": CSVWriter, "jsonl": JSONLWriter, "columnar": ColumnarWriter}
+
+
+def read_columnar(stream):
+    """Yields rows of text values (None for empty) back from a columnar export."""
+    import json
+
+    if stream.readline() != MAGIC:
+        raise ValueError("Not a columnar export.")
+    columns = json.loads(stream.readline())
+    while True:
+        header = stream.read(_UINT32.size)
+        if not header:
+            return
+        count = _UINT32.unpack(header)[0]
+        blocks = []
+        for _ in columns:
+            size = _UINT32.unpack(stream.read(_UINT32.size))[0]
+            values = stream.read(size).decode().split("\0") if count else []
+            blocks.append([value or None for value in values])
+        yield from zip(*blocks)
+
+
+class ExportPipeline:
+    """Writes chunks of rows to a binary stream from a single background writer."""
+
+    def __init__(self, stream, columns, fmt="csv", chunk_rows=10000, max_chunks=8):
+        if fmt not in WRITERS:
+            raise ValueError(f"Unknown export format {fmt!r}; expected one of {', '.join(FORMATS)}.")
+        self.rows = 0
+        self.error = None
+        self._writer = WRITERS[fmt](stream, columns)
+        self._chunk_rows = chunk_rows
+        self._chunk = []
+        self._pool = WorkerPool(self._write_chunk, max_pending=max_chunks)
+
+    def write(self, rows):
+        """Queues rows in chunks; raises the writer's error as soon as it has one, without reading further rows."""
+        for row in rows:
+            self._chunk.append(row)
+            if len(self._chunk) >= self._chunk_rows:
+                if self.error is not None:
+                    raise self.error
+                self._pool.put(self._chunk)
+                self._chunk = []
+
+    def close(self):
+        """Writes the last partial chunk, waits for the writer and re-raises any error it hit."""
+        if self._chunk:
+            self._pool.put(self._chunk)
+            self._chunk = []
+        self._pool.join()
+        if self.error is None:
+            try:
+                self._writer.close()
+            except Exception as e:
+                self.error = e
+        if self.error is not None:
+            raise self.error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _write_chunk(self, chunk):
+        if self.error is not None:
+            # Keep draining so the producer never blocks on a dead writer.
+            return
+        try:
+            self._writer.write_chunk(chunk)
+            self.rows += len(chunk)
+        except Exception as e:
+            self.error = e
+
+
+def export(manager, dataset, path, fmt="csv", compress=False, chunk_rows=10000, max_chunks=8):
+    """Streams a dataset to path, gzip-compressed if compress is set; returns the row count."""
+    if dataset not in DATASETS:
+        raise ValueError(f"Unknown dataset {dataset!r}; expected one of {', '.join(DATASETS)}.")
+    if fmt not in WRITERS:
+        raise ValueError(f"Unknown export format {fmt!r}; expected one of {', '.join(FORMATS)}.")
+    columns, rows = DATASETS[dataset]
+    if compress:
+        import gzip
+
+        stream = gzip.open(path, "wb", compresslevel=6)
+    else:
+        stream = open(path, "wb", buffering=1 << 20)
+    with stream:
+        with ExportPipeline(stream, columns, fmt, chunk_rows, max_chunks) as pipeline:
+            pipeline.write(rows(manager))
+    return pipeline.rows
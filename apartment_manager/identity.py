@@ -0,0 +1,110 @@
+import itertools
+
+
+class InternTable:
+    """Assigns each distinct external key, such as a unit number, a small integer id and back."""
+
+    def __init__(self):
+        self._ids = {}
+        self.keys = []
+
+    def __len__(self):
+        return len(self.keys)
+
+    def intern(self, key):
+        key_id = self._ids.get(key)
+        if key_id is None:
+            key_id = self._ids[key] = len(self.keys)
+            self.keys.append(key)
+        return key_id
+
+    def get(self, key):
+        """Returns the id of key, or None if it was never interned."""
+        return self._ids.get(key)
+
+
+class EntityTable:
+    """Dense integer ids for one kind of entity, stored in a list indexed by id.
+
+    Ids are never reused, so an id kept in a ledger, report or change record
+    cannot come to mean a different entity after a delete.
+    """
+
+    def __init__(self):
+        self._rows = []
+        self._live = 0
+
+    def __len__(self):
+        return self._live
+
+    def __iter__(self):
+        return (entity for entity in self._rows if entity is not None)
+
+    @property
+    def next_id(self):
+        """The id the next add() will assign."""
+        return len(self._rows)
+
+    def add(self, entity):
+        entity_id = len(self._rows)
+        self._rows.append(entity)
+        self._live += 1
+        return entity_id
+
+    def get(self, entity_id):
+        if isinstance(entity_id, int) and 0 <= entity_id < len(self._rows):
+            return self._rows[entity_id]
+        return None
+
+    def remove(self, entity_id):
+        if self.get(entity_id) is not None:
+            self._rows[entity_id] = None
+            self._live -= 1
+
+
+class EntityList:
+    """Entities in insertion order, with O(1) append and remove, used where a plain list was.
+
+    Iteration, len, membership, indexing and comparison with lists behave as
+    they did for the list; only remove() no longer shifts everything after it.
+    """
+
+    __hash__ = None
+
+    def __init__(self, entities=()):
+        self._entities = dict.fromkeys(entities)
+
+    def __len__(self):
+        return len(self._entities)
+
+    def __iter__(self):
+        return iter(self._entities)
+
+    def __contains__(self, entity):
+        return entity in self._entities
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return list(self._entities)[position]
+        if position < 0:
+            position += len(self._entities)
+        if not 0 <= position < len(self._entities):
+            raise IndexError("EntityList index out of range")
+        return next(itertools.islice(self._entities, position, None))
+
+    def __eq__(self, other):
+        if isinstance(other, (list, EntityList)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"EntityList({list(self._entities)!r})"
+
+    def append(self, entity):
+        self._entities[entity] = None
+
+    def remove(self, entity):
+        try:
+            del self._entities[entity]
+        except KeyError:
+            raise ValueError(f"{entity!r} is not in the list") from None
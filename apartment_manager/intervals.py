@@ -0,0 +1,82 @@
+import bisect
+import datetime
+
+
+class LeaseIntervalIndex:
+    """Sorted lease endpoints for point-in-time counts and expiry scans, plus per-unit intervals.
+
+    A unit's leases never overlap, so the only lease that can cover a window on a
+    unit is the last one starting on or before the window's end. Entries are keyed
+    by lease and apartment id, with the lease id breaking ties between equal dates.
+    """
+
+    def __init__(self):
+        self._starts = []
+        self._ends = []
+        self._entries = {}
+        self._by_unit = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def add(self, lease):
+        entry = (lease.start_date, lease.id, lease.end_date, lease)
+        self._entries[lease.id] = entry
+        bisect.insort(self._starts, lease.start_date)
+        bisect.insort(self._ends, (lease.end_date, lease.id, lease))
+        bisect.insort(self._by_unit.setdefault(lease.apartment.id, []), entry)
+
+    def remove(self, lease):
+        entry = self._entries.pop(lease.id, None)
+        if entry is None:
+            return
+        start, lease_id, end, _ = entry
+        del self._starts[bisect.bisect_left(self._starts, start)]
+        del self._ends[bisect.bisect_left(self._ends, (end, lease_id))]
+        intervals = self._by_unit[lease.apartment.id]
+        del intervals[bisect.bisect_left(intervals, entry[:2])]
+        if not intervals:
+            del self._by_unit[lease.apartment.id]
+
+    def update(self, lease):
+        """Re-indexes a lease after its dates changed."""
+        self.remove(lease)
+        self.add(lease)
+
+    def active_count(self, day):
+        """Number of leases covering day: started on or before it and not ended before it."""
+        return bisect.bisect_right(self._starts, day) - bisect.bisect_left(self._ends, (day,))
+
+    def ending_between(self, start, end):
+        """Returns leases whose end date falls in start..end, soonest first."""
+        low = 0 if start is None else bisect.bisect_left(self._ends, (start,))
+        high = bisect.bisect_left(self._ends, (end + datetime.timedelta(days=1),))
+        return [lease for _, _, lease in self._ends[low:high]]
+
+    def lease_at(self, apartment, day):
+        return self.covering(apartment, day, day)
+
+    def covering(self, apartment, start, end):
+        """Returns the lease on apartment overlapping start..end, if any."""
+        intervals = self._by_unit.get(apartment.id)
+        if not intervals:
+            return None
+        position = bisect.bisect_right(intervals, (end, float("inf"))) - 1
+        if position >= 0 and intervals[position][2] >= start:
+            return intervals[position][3]
+        return None
+
+    def nearest(self, apartment, day):
+        """The lease on apartment covering day, else the next to start after it, else the last before it."""
+        intervals = self._by_unit.get(apartment.id)
+        if not intervals:
+            return None
+        position = bisect.bisect_right(intervals, (day, float("inf"))) - 1
+        if position >= 0 and intervals[position][2] >= day:
+            return intervals[position][3]
+        if position + 1 < len(intervals):
+            return intervals[position + 1][3]
+        return intervals[position][3]
+
+    def leases_for(self, apartment):
+        return [entry[3] for entry in self._by_unit.get(apartment.id, ())]
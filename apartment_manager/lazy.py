@@ -0,0 +1,38 @@
+class LazyList:
+    """List attribute materialized from a registered loader on first access.
+
+    Entities loaded from storage register a zero-argument loader under the
+    attribute name in ``instance._loaders``; entities created in memory simply
+    start with an empty list.
+    """
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.slot = "_" + name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        try:
+            return instance.__dict__[self.slot]
+        except KeyError:
+            loader = instance._loaders.pop(self.name, None)
+            value = list(loader()) if loader else []
+            instance.__dict__[self.slot] = value
+            return value
+
+    def __set__(self, instance, value):
+        instance._loaders.pop(self.name, None)
+        instance.__dict__[self.slot] = value
+
+
+def is_loaded(instance, name):
+    return "_" + name in instance.__dict__
+
+
+def iter_uncached(instance, name):
+    """Iterates a LazyList attribute, reading it from the loader without caching it if not yet loaded."""
+    if is_loaded(instance, name):
+        return iter(getattr(instance, name))
+    loader = instance._loaders.get(name)
+    return iter(loader()) if loader else iter(())
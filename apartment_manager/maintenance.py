@@ -0,0 +1,81 @@
+import bisect
+import collections
+
+CLOSED_STATUSES = ("Completed", "Closed")
+
+# Upper bounds of the latency histogram buckets, in hours; the last bucket is open-ended.
+LATENCY_BOUNDS_HOURS = (1, 4, 24, 72, 168)
+
+
+class LatencyHistogram:
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BOUNDS_HOURS) + 1)
+        self.count = 0
+        self.total_hours = 0.0
+
+    def add(self, delta):
+        hours = delta.total_seconds() / 3600
+        self.counts[bisect.bisect_left(LATENCY_BOUNDS_HOURS, hours)] += 1
+        self.count += 1
+        self.total_hours += hours
+
+    @property
+    def mean_hours(self):
+        return self.total_hours / self.count if self.count else 0
+
+    def __str__(self):
+        labels = [f"<={bound}h" for bound in LATENCY_BOUNDS_HOURS] + [f">{LATENCY_BOUNDS_HOURS[-1]}h"]
+        buckets = ", ".join(f"{label}: {count}" for label, count in zip(labels, self.counts))
+        return f"{self.count} requests, mean {self.mean_hours:.1f}h ({buckets})"
+
+
+class MaintenanceStats:
+    """Running maintenance counters and latency histograms, updated as requests move through statuses."""
+
+    def __init__(self):
+        self.by_status = collections.Counter()
+        self.by_unit = collections.defaultdict(collections.Counter)
+        self.by_staff = collections.defaultdict(collections.Counter)
+        self.time_to_assign = LatencyHistogram()
+        self.time_to_close = LatencyHistogram()
+        self.staff_time_to_close = collections.defaultdict(LatencyHistogram)
+
+    def _count(self, unit, request, step):
+        # Requests attached outside the manager were never submitted here, so are not counted.
+        if "submitted_at" not in request:
+            return
+        self.by_status[request["status"]] += step
+        self.by_unit[unit][request["status"]] += step
+        if "staff" in request:
+            self.by_staff[request["staff"]][request["status"]] += step
+
+    def submitted(self, unit, request, at):
+        request["timestamps"] = {request["status"]: at}
+        request["submitted_at"] = at
+        self._count(unit, request, 1)
+
+    def assigned(self, unit, request, staff, at):
+        self._count(unit, request, -1)
+        if "assigned_at" not in request and "submitted_at" in request:
+            self.time_to_assign.add(at - request["submitted_at"])
+        request.setdefault("assigned_at", at)
+        request["staff"] = staff
+        self._count(unit, request, 1)
+
+    def status_changed(self, unit, request, status, at):
+        self._count(unit, request, -1)
+        request["status"] = status
+        request.setdefault("timestamps", {})[status] = at
+        if status in CLOSED_STATUSES and "closed_at" not in request and "submitted_at" in request:
+            request["closed_at"] = at
+            self.time_to_close.add(at - request["submitted_at"])
+            if "staff" in request:
+                self.staff_time_to_close[request["staff"]].add(at - request["submitted_at"])
+        self._count(unit, request, 1)
+
+    def removed(self, unit, request):
+        self._count(unit, request, -1)
+
+    def open_backlog(self, unit=None):
+        counts = self.by_status if unit is None else self.by_unit.get(unit, {})
+        return sum(count for status, count in counts.items() if status not in CLOSED_STATUSES)
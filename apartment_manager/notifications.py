@@ -0,0 +1,98 @@
+import collections
+import threading
+
+from apartment_manager.workers import WorkerPool
+
+Notice = collections.namedtuple("Notice", "tenant_id tenant address channel kind key message")
+
+
+class FileSink:
+    """Appends each delivered batch to a text file, one notice per line."""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def deliver(self, tenant, channel, notices):
+        lines = "".join(f"{tenant}\t{channel}\t{n.address}\t{n.kind}\t{n.message}\n" for n in notices)
+        with self._lock, open(self.path, "a") as stream:
+            stream.write(lines)
+
+
+class SMTPSink:
+    """Sends one email per batch through an SMTP server, by default a local relay."""
+
+    def __init__(self, host="localhost", port=25, sender="noreply@localhost"):
+        self.host = host
+        self.port = port
+        self.sender = sender
+
+    def deliver(self, tenant, channel, notices):
+        import smtplib
+        from email.message import EmailMessage
+
+        message = EmailMessage()
+        message["From"] = self.sender
+        message["To"] = notices[0].address
+        message["Subject"] = f"{len(notices)} reminder(s) for {tenant}"
+        message.set_content("\n".join(n.message for n in notices))
+        with smtplib.SMTP(self.host, self.port) as server:
+            server.send_message(message)
+
+
+class NotificationPipeline:
+    """Deduplicates notices, batches them per tenant and channel, and delivers from worker threads."""
+
+    def __init__(self, sink, workers=4, batch_size=20, max_pending=100):
+        self.sink = sink
+        self.batch_size = batch_size
+        self.delivered = 0
+        self.failures = []
+        self._seen = set()
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._pool = WorkerPool(self._deliver, workers, max_pending)
+
+    def submit(self, notices):
+        """Queues notices not seen before; returns how many were accepted."""
+        accepted = 0
+        for notice in notices:
+            # Keyed by tenant id: two tenants may share a name but never an inbox.
+            identity = (notice.tenant_id, notice.channel, notice.kind, notice.key)
+            if identity in self._seen:
+                continue
+            self._seen.add(identity)
+            accepted += 1
+            recipient = (notice.tenant_id, notice.channel)
+            batch = self._pending.setdefault(recipient, [])
+            batch.append(notice)
+            if len(batch) >= self.batch_size:
+                self._pool.put(self._pending.pop(recipient))
+        return accepted
+
+    def flush(self):
+        """Hands every partially filled batch to the workers."""
+        for batch in self._pending.values():
+            self._pool.put(batch)
+        self._pending.clear()
+
+    def close(self):
+        """Flushes, waits for every batch to be delivered and stops the workers."""
+        self.flush()
+        self._pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _deliver(self, batch):
+        try:
+            self.sink.deliver(batch[0].tenant, batch[0].channel, batch)
+        except Exception as e:
+            with self._lock:
+                self.failures.append((batch, e))
+        else:
+            with self._lock:
+                self.delivered += len(batch)
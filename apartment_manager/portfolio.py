@@ -0,0 +1,73 @@
+from apartment_manager.apartment_manager import ApartmentManager
+
+
+class Portfolio:
+    """Owns one ApartmentManager per property and routes work to the shards it concerns."""
+
+    def __init__(self):
+        self.properties = {}
+
+    def add_property(self, property_id):
+        if property_id in self.properties:
+            raise ValueError(f"Property {property_id} already exists.")
+        manager = ApartmentManager()
+        self.properties[property_id] = manager
+        return manager
+
+    def remove_property(self, property_id):
+        self.manager(property_id)
+        del self.properties[property_id]
+        return f"Property {property_id} removed."
+
+    def manager(self, property_id):
+        manager = self.properties.get(property_id)
+        if manager is None:
+            raise ValueError(f"Property {property_id} not found.")
+        return manager
+
+    def route(self, property_id, operation, *args, **kwargs):
+        """Calls an ApartmentManager method on the shard owning property_id."""
+        return getattr(self.manager(property_id), operation)(*args, **kwargs)
+
+    def _shards(self, property_ids=None):
+        if property_ids is None:
+            return list(self.properties.items())
+        return [(property_id, self.manager(property_id)) for property_id in property_ids]
+
+    def search_apartments(self, property_ids=None, **filters):
+        results = [
+            f"[{property_id}] {record}"
+            for property_id, manager in self._shards(property_ids)
+            for record in manager.find_apartments(**filters)
+        ]
+        return results or ["No apartments match the search criteria."]
+
+    def overdue_payments(self, property_ids=None):
+        return [
+            f"[{property_id}] {line}"
+            for property_id, manager in self._shards(property_ids)
+            for line in manager.overdue_payments()
+        ]
+
+    def generate_outstanding_report(self, property_ids=None):
+        report = [
+            f"[{property_id}] {tenant.name}: ${tenant.balance_due}"
+            for property_id, manager in self._shards(property_ids)
+            for tenant in manager.tenants
+            if tenant.balance_due > 0
+        ]
+        return "\n".join(report) if report else "No outstanding balances found."
+
+    def apartment_occupancy_report(self, property_ids=None):
+        total_units = 0
+        occupied_units = 0
+        for _, manager in self._shards(property_ids):
+            total_units += len(manager.apartments)
+            occupied_units += sum(1 for apt in manager.apartments if not apt.is_available)
+        occupancy_rate = (occupied_units / total_units) * 100 if total_units else 0
+        return (f"Total Apartments: {total_units}\n"
+                f"Occupied Apartments: {occupied_units}\n"
+                f"Occupancy Rate: {occupancy_rate:.2f}%")
+
+    def calculate_total_annual_rent(self, property_ids=None):
+        return sum(manager.calculate_total_annual_rent() for _, manager in self._shards(property_ids))
@@ -0,0 +1,74 @@
+import datetime
+
+
+def _month_index(day):
+    return day.year * 12 + day.month - 1
+
+
+def _month_start(index):
+    return datetime.date(index // 12, index % 12 + 1, 1)
+
+
+def _days_in_month(index):
+    return (_month_start(index + 1) - _month_start(index)).days
+
+
+class RentProjection:
+    """Projects expected monthly rent revenue from lease dates, cached per horizon."""
+
+    def __init__(self, manager):
+        self.manager = manager
+        self._cache = {}
+
+    def monthly_revenue(self, start, end):
+        """Returns a list of (month_start, revenue) pairs covering start..end."""
+        key = (_month_index(start), _month_index(end))
+        if key not in self._cache:
+            self._cache[key] = self._compute(*key)
+        return list(self._cache[key])
+
+    def invalidate(self, start=None, end=None):
+        """Drops cached horizons overlapping start..end, or every horizon if no range is given."""
+        if start is None or end is None:
+            self._cache.clear()
+            return
+        first, last = _month_index(start), _month_index(end)
+        stale = [key for key in self._cache if key[0] <= last and first <= key[1]]
+        for key in stale:
+            del self._cache[key]
+
+    def _compute(self, first, last):
+        months = last - first + 1
+        if months <= 0:
+            return []
+        horizon_start = _month_start(first)
+        horizon_end = _month_start(last + 1) - datetime.timedelta(days=1)
+
+        # Full months are accumulated in a difference array so each lease costs
+        # O(1) no matter how long it runs; only the two edge months are prorated.
+        full = [0] * (months + 1)
+        partial = [0.0] * months
+        for lease in self.manager.leases:
+            start = max(lease.start_date, horizon_start)
+            end = min(lease.end_date, horizon_end)
+            if start > end:
+                continue
+            rent = lease.apartment.rent
+            lo = _month_index(start) - first
+            hi = _month_index(end) - first
+            if lo == hi:
+                days = (end - start).days + 1
+                partial[lo] += rent * days / _days_in_month(lo + first)
+                continue
+            lead_days = _days_in_month(lo + first) - start.day + 1
+            partial[lo] += rent * lead_days / _days_in_month(lo + first)
+            partial[hi] += rent * end.day / _days_in_month(hi + first)
+            full[lo + 1] += rent
+            full[hi] -= rent
+
+        revenue = []
+        running = 0
+        for offset in range(months):
+            running += full[offset]
+            revenue.append((_month_start(first + offset), round(running + partial[offset], 2)))
+        return revenue
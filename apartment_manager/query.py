@@ -0,0 +1,238 @@
+import bisect
+import itertools
+
+from apartment_manager.apartment_manager import _to_date
+
+INDEXED_FIELDS = ("rent", "bedrooms", "bathrooms")
+
+# Fields without an index are filtered row by row; assume each keeps about a third of the rows.
+RESIDUAL_SELECTIVITY = 1 / 3
+
+
+def _lease_end(apartment):
+    lease = apartment.current_lease()
+    return lease.end_date if lease else None
+
+
+def _balance(apartment):
+    lease = apartment.current_lease()
+    return lease.tenant.balance_due if lease else None
+
+
+class Field:
+    """A queryable apartment attribute; comparisons build predicates."""
+
+    __hash__ = None
+
+    def __init__(self, name, getter, coerce=None):
+        self.name = name
+        self.getter = getter
+        self.coerce = coerce or (lambda value: value)
+
+    def _range(self, low=None, high=None, low_inclusive=True, high_inclusive=True):
+        low = None if low is None else self.coerce(low)
+        high = None if high is None else self.coerce(high)
+        return Predicate(self, low, high, low_inclusive, high_inclusive)
+
+    def __eq__(self, value):
+        return self._range(value, value)
+
+    def __ge__(self, value):
+        return self._range(low=value)
+
+    def __gt__(self, value):
+        return self._range(low=value, low_inclusive=False)
+
+    def __le__(self, value):
+        return self._range(high=value)
+
+    def __lt__(self, value):
+        return self._range(high=value, high_inclusive=False)
+
+    def between(self, low, high):
+        return self._range(low, high)
+
+
+rent = Field("rent", lambda a: a.rent)
+bedrooms = Field("bedrooms", lambda a: a.bedrooms)
+bathrooms = Field("bathrooms", lambda a: a.bathrooms)
+available = Field("available", lambda a: a.is_available)
+lease_end = Field("lease_end", _lease_end, _to_date)
+balance = Field("balance", _balance)
+
+
+class Predicate:
+    def __init__(self, field, low, high, low_inclusive, high_inclusive):
+        self.field = field
+        self.low = low
+        self.high = high
+        self.low_inclusive = low_inclusive
+        self.high_inclusive = high_inclusive
+
+    def matches(self, apartment):
+        value = self.field.getter(apartment)
+        if value is None:
+            return False
+        if self.low is not None and (value < self.low or (value == self.low and not self.low_inclusive)):
+            return False
+        if self.high is not None and (value > self.high or (value == self.high and not self.high_inclusive)):
+            return False
+        return True
+
+    def __and__(self, other):
+        return Query(self) & other
+
+    def __str__(self):
+        if self.low is not None and self.low == self.high:
+            return f"{self.field.name} = {self.low}"
+        bounds = []
+        if self.low is not None:
+            bounds.append(f"{self.field.name} {'>=' if self.low_inclusive else '>'} {self.low}")
+        if self.high is not None:
+            bounds.append(f"{self.field.name} {'<=' if self.high_inclusive else '<'} {self.high}")
+        return " and ".join(bounds) or f"{self.field.name} is set"
+
+
+class ApartmentIndex:
+    """Sorted (value, seq) lists per indexed field, kept in step with the manager's apartments.
+
+    Each indexed apartment points back at the index, so assigning its rent,
+    bedrooms or bathrooms reindexes it straight away.
+    """
+
+    def __init__(self, apartments=()):
+        self._seq = itertools.count()
+        self._seq_of = {}
+        self._by_seq = {}
+        self._values = {}
+        self._sorted = {name: [] for name in INDEXED_FIELDS}
+        for apartment in apartments:
+            self.add(apartment)
+
+    def __len__(self):
+        return len(self._by_seq)
+
+    def add(self, apartment):
+        seq = next(self._seq)
+        self._seq_of[apartment] = seq
+        self._by_seq[seq] = apartment
+        self._insert(apartment, seq)
+        apartment.search_index = self
+
+    def remove(self, apartment):
+        seq = self._seq_of.pop(apartment, None)
+        if seq is None:
+            return
+        del self._by_seq[seq]
+        self._delete(seq)
+        if apartment.search_index is self:
+            apartment.search_index = None
+
+    def reindex(self, apartment):
+        """Refreshes an apartment's entries after its indexed attributes changed, keeping its order."""
+        seq = self._seq_of.get(apartment)
+        if seq is None:
+            return
+        self._delete(seq)
+        self._insert(apartment, seq)
+
+    def _insert(self, apartment, seq):
+        values = tuple(getattr(apartment, name) for name in INDEXED_FIELDS)
+        self._values[seq] = values
+        for name, value in zip(INDEXED_FIELDS, values):
+            bisect.insort(self._sorted[name], (value, seq))
+
+    def _delete(self, seq):
+        for name, value in zip(INDEXED_FIELDS, self._values.pop(seq)):
+            entries = self._sorted[name]
+            del entries[bisect.bisect_left(entries, (value, seq))]
+
+    def _bounds(self, predicate):
+        entries = self._sorted[predicate.field.name]
+        start, stop = 0, len(entries)
+        if predicate.low is not None:
+            search = bisect.bisect_left if predicate.low_inclusive else bisect.bisect_right
+            start = search(entries, (predicate.low, -1 if predicate.low_inclusive else float("inf")))
+        if predicate.high is not None:
+            search = bisect.bisect_right if predicate.high_inclusive else bisect.bisect_left
+            stop = search(entries, (predicate.high, float("inf") if predicate.high_inclusive else -1))
+        return start, max(start, stop)
+
+    def estimate(self, predicate):
+        start, stop = self._bounds(predicate)
+        return stop - start
+
+    def lookup(self, predicate):
+        start, stop = self._bounds(predicate)
+        return {seq for _, seq in self._sorted[predicate.field.name][start:stop]}
+
+    def apartments(self, seqs):
+        return [self._by_seq[seq] for seq in sorted(seqs)]
+
+    def all_seqs(self):
+        return self._by_seq.keys()
+
+
+class Query:
+    """A conjunction of predicates over apartments, planned against ApartmentIndex."""
+
+    def __init__(self, *predicates):
+        self.predicates = list(predicates)
+
+    def where(self, predicate):
+        return Query(*self.predicates, predicate)
+
+    def __and__(self, other):
+        extra = other.predicates if isinstance(other, Query) else [other]
+        return Query(*self.predicates, *extra)
+
+    def plan(self, index):
+        """Orders index-backed predicates by estimated rows; the rest become residual filters."""
+        indexed = []
+        residual = []
+        for predicate in self.predicates:
+            if predicate.field.name in INDEXED_FIELDS:
+                indexed.append((index.estimate(predicate), predicate))
+            else:
+                residual.append((RESIDUAL_SELECTIVITY, predicate))
+        indexed.sort(key=lambda step: step[0])
+        return indexed, residual
+
+    def run(self, manager):
+        return self._execute(manager.apartment_index)[0]
+
+    def _execute(self, index):
+        indexed, residual = self.plan(index)
+        steps = []
+        if indexed:
+            estimate, predicate = indexed[0]
+            candidates = index.lookup(predicate)
+            steps.append((f"Index scan {predicate}", estimate, len(candidates)))
+            for estimate, predicate in indexed[1:]:
+                # Intersecting costs the other side's row count; once that exceeds the
+                # surviving candidates, checking each candidate directly is cheaper.
+                if estimate <= len(candidates):
+                    scanned = index.lookup(predicate)
+                    candidates &= scanned
+                    steps.append((f"Intersect index {predicate}", estimate, len(scanned)))
+                else:
+                    residual.append((estimate / max(len(index), 1), predicate))
+        else:
+            candidates = set(index.all_seqs())
+            steps.append(("Full scan", len(candidates), len(candidates)))
+
+        results = index.apartments(candidates)
+        residual.sort(key=lambda step: step[0])
+        for selectivity, predicate in residual:
+            scanned = len(results)
+            results = [apartment for apartment in results if predicate.matches(apartment)]
+            steps.append((f"Filter {predicate}", round(scanned * selectivity), scanned))
+        return results, steps
+
+    def explain(self, manager):
+        """Describes the chosen plan with estimated and actual rows scanned at each step."""
+        results, steps = self._execute(manager.apartment_index)
+        lines = [f"{description}: estimated {estimate} rows, scanned {actual} rows"
+                 for description, estimate, actual in steps]
+        lines.append(f"Returned {len(results)} rows")
+        return "\n".join(lines)
@@ -0,0 +1,88 @@
+"""Lightweight result records returned by ApartmentManager.
+
+Each record is a namedtuple (no per-instance __dict__) whose __str__ renders the
+same text the string-returning manager methods have always produced, so
+formatting only happens when something actually prints the record.
+"""
+import collections
+import datetime
+
+
+class PaymentRecord(collections.namedtuple("PaymentRecord", "amount date")):
+    __slots__ = ()
+
+    def __str__(self):
+        return f"${self.amount} on {self.date}"
+
+
+class ApartmentRecord(collections.namedtuple("ApartmentRecord", "unit_number bedrooms bathrooms rent is_available")):
+    __slots__ = ()
+
+    @classmethod
+    def of(cls, apartment):
+        return cls(apartment.unit_number, apartment.bedrooms, apartment.bathrooms,
+                   apartment.rent, apartment.is_available)
+
+    def __str__(self):
+        return (f"Apartment {self.unit_number}: {self.bedrooms}BR/{self.bathrooms}BA, "
+                f"${self.rent}/month, Status: {'Available' if self.is_available else 'Occupied'}")
+
+
+class LeaseRecord(collections.namedtuple("LeaseRecord", "tenant unit_number start_date end_date payments")):
+    __slots__ = ()
+
+    @classmethod
+    def of(cls, lease):
+        payments = tuple(PaymentRecord(p["amount"], p["date"]) for p in lease.payments)
+        return cls(lease.tenant.name, lease.apartment.unit_number, lease.start_date, lease.end_date, payments)
+
+    def __str__(self):
+        payments_info = "\n".join(str(p) for p in self.payments)
+        return (f"Lease for {self.tenant} in {self.unit_number}: "
+                f"{self.start_date} to {self.end_date}\nPayments:\n{payments_info}")
+
+
+class TenantProfile(collections.namedtuple("TenantProfile", "name phone email balance_due leases")):
+    __slots__ = ()
+
+    def __str__(self):
+        lease_info = "\n".join(str(l) for l in self.leases)
+        return (f"Profile for {self.name}:\n"
+                f"Contact: {self.phone}, {self.email}\n"
+                f"Balance Due: ${self.balance_due}\n"
+                f"Leases:\n{lease_info}")
+
+
+class MonthlyReport(collections.namedtuple("MonthlyReport", "year month rent_collected outstanding_balances")):
+    __slots__ = ()
+
+    def __str__(self):
+        return (f"Monthly Report for {self.month}/{self.year}\n"
+                f"Total Rent Collected: ${self.rent_collected}\n"
+                f"Total Outstanding Balances: ${self.outstanding_balances}")
+
+
+class OccupancyReport(collections.namedtuple("OccupancyReport", "total_units occupied_units occupancy_rate as_of")):
+    __slots__ = ()
+
+    def __str__(self):
+        return (f"Total Apartments: {self.total_units}\n"
+                f"Occupied Apartments: {self.occupied_units}\n"
+                f"Occupancy Rate: {self.occupancy_rate:.2f}%")
+
+
+def as_dict(value):
+    """Converts records (and lists or tuples of them) into JSON-ready builtins."""
+    if hasattr(value, "_asdict"):
+        return {key: as_dict(item) for key, item in value._asdict().items()}
+    if isinstance(value, (list, tuple)):
+        return [as_dict(item) for item in value]
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    return value
+
+
+def to_json(value):
+    import json
+
+    return json.dumps(as_dict(value))
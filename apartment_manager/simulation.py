@@ -0,0 +1,189 @@
+"""Month-by-month portfolio simulation for capacity planning.
+
+Each Scenario replays synthetic leasing, rent, payment, fee and maintenance
+activity through the public ApartmentManager API and reports business metrics
+alongside per-operation throughput. Independent scenarios run in a process pool:
+
+    python -m apartment_manager.simulation --processes 4
+"""
+import argparse
+import collections
+import concurrent.futures
+import datetime
+import random
+import time
+
+from apartment_manager.apartment_manager import ApartmentManager
+
+Scenario = collections.namedtuple(
+    "Scenario",
+    "name units tenants months late_fee lease_months rent_change pay_rate seed start",
+    defaults=(100, 150, 36, 50, 12, 0.03, 0.9, 0, datetime.date(2025, 1, 1)),
+)
+OperationStats = collections.namedtuple("OperationStats", "calls seconds per_second")
+ScenarioResult = collections.namedtuple(
+    "ScenarioResult",
+    "scenario collected fees_charged average_occupancy outstanding over_90_days "
+    "maintenance_closed operations",
+)
+
+
+def _add_months(day, months):
+    index = day.year * 12 + day.month - 1 + months
+    return datetime.date(index // 12, index % 12 + 1, 1)
+
+
+class _Timer:
+    """Calls manager methods and accumulates per-operation call counts and wall time."""
+
+    def __init__(self, manager):
+        self.manager = manager
+        self.calls = collections.Counter()
+        self.seconds = collections.Counter()
+
+    def __call__(self, operation, *args, **kwargs):
+        method = getattr(self.manager, operation)
+        start = time.perf_counter()
+        result = method(*args, **kwargs)
+        self.seconds[operation] += time.perf_counter() - start
+        self.calls[operation] += 1
+        return result
+
+    def stats(self):
+        return {
+            operation: OperationStats(calls, self.seconds[operation],
+                                      calls / self.seconds[operation] if self.seconds[operation] else 0)
+            for operation, calls in sorted(self.calls.items())
+        }
+
+
+def simulate(scenario):
+    rng = random.Random(scenario.seed)
+    manager = ApartmentManager()
+    call = _Timer(manager)
+
+    units = [str(100 + i) for i in range(scenario.units)]
+    for unit in units:
+        call("add_apartment", unit, rng.randint(1, 3), rng.randint(1, 2), rng.randrange(900, 2500, 50))
+    tenants = [f"Tenant {i}" for i in range(scenario.tenants)]
+    for i, name in enumerate(tenants):
+        call("add_tenant", name, f"555{i:07d}", f"tenant{i}@example.com")
+
+    collected = 0
+    fees_charged = 0
+    occupancy_total = 0.0
+    for month in range(scenario.months):
+        month_start = _add_months(scenario.start, month)
+        month_end = _add_months(scenario.start, month + 1) - datetime.timedelta(days=1)
+
+        if month and month % 12 == 0 and scenario.rent_change:
+            for unit in units:
+                apartment = manager.find_apartment(unit)
+                call("set_rent", unit, round(apartment.rent * (1 + scenario.rent_change), 2))
+
+        # Sign new leases on roughly half of the vacant units, one lease per tenant per month.
+        vacant = call("vacant_units", month_start, month_end)
+        movers = rng.sample(tenants, min(len(tenants), len(vacant)))
+        lease_end = _add_months(month_start, scenario.lease_months) - datetime.timedelta(days=1)
+        new_leases = [(tenant, unit, month_start, lease_end)
+                      for tenant, unit in zip(movers, vacant) if rng.random() < 0.5]
+        if new_leases:
+            call("create_leases", new_leases)
+        new_units = {unit for _, unit, _, _ in new_leases}
+
+        # Post this month's rent for continuing leases; new leases were charged when signed.
+        rent_due = collections.defaultdict(list)
+        for apartment in manager.apartments:
+            lease = manager.lease_intervals.lease_at(apartment, month_start)
+            if lease and apartment.unit_number not in new_units:
+                rent_due[apartment.rent].append(lease.tenant.name)
+        for rent, names in rent_due.items():
+            call("apply_fees", names, rent, month_start)
+
+        payments = []
+        for tenant in manager.tenants:
+            if tenant.balance_due > 0 and rng.random() < scenario.pay_rate:
+                amount = tenant.balance_due if rng.random() < 0.8 else round(tenant.balance_due / 2, 2)
+                payments.append((tenant.name, amount, month_end))
+                collected += amount
+        if payments:
+            call("post_payments", payments)
+
+        if scenario.late_fee:
+            late = sum(1 for tenant in manager.tenants if tenant.balance_due > 0)
+            call("apply_late_fees", scenario.late_fee, month_start)
+            fees_charged += late * scenario.late_fee
+
+        for unit in rng.sample(units, max(1, scenario.units // 20)):
+            call("submit_maintenance_request", unit, "Routine repair")
+            call("assign_maintenance_staff", unit, rng.choice(("John", "Mary", "Ana")))
+            newest = len(manager.find_apartment(unit).maintenance_requests) - 1
+            call("update_maintenance_status", unit, newest, "Completed")
+
+        occupancy_total += call("occupancy", month_start).occupancy_rate
+        call("search_apartments", max_rent=1500, min_bedrooms=2)
+
+    as_of = _add_months(scenario.start, scenario.months)
+    call("delinquency_report", as_of)
+    buckets = manager.aging.buckets(as_of)
+    return ScenarioResult(
+        scenario,
+        round(collected, 2),
+        fees_charged,
+        round(occupancy_total / scenario.months, 2) if scenario.months else 0,
+        round(sum(tenant.balance_due for tenant in manager.tenants), 2),
+        round(buckets["90+"], 2),
+        manager.maintenance_stats.by_status["Completed"],
+        call.stats(),
+    )
+
+
+def run_scenarios(scenarios, processes=None):
+    """Runs independent scenarios in a process pool; processes=1 runs them in this process."""
+    if processes == 1:
+        return [simulate(scenario) for scenario in scenarios]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=processes) as pool:
+        return list(pool.map(simulate, scenarios))
+
+
+def format_result(result):
+    lines = [
+        f"Scenario {result.scenario.name}: late fee ${result.scenario.late_fee}, "
+        f"{result.scenario.lease_months}-month leases, rent change {result.scenario.rent_change:.1%}",
+        f"  Collected: ${result.collected:.2f}  Late fees: ${result.fees_charged:.2f}  "
+        f"Average occupancy: {result.average_occupancy:.2f}%",
+        f"  Outstanding: ${result.outstanding:.2f}  Over 90 days: ${result.over_90_days:.2f}  "
+        f"Maintenance closed: {result.maintenance_closed}",
+    ]
+    for operation, stats in result.operations.items():
+        lines.append(f"  {operation:<28} {stats.calls:>7} calls  {stats.per_second:>12,.0f} ops/s")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate leasing policies against ApartmentManager.")
+    parser.add_argument("--units", type=int, default=100)
+    parser.add_argument("--tenants", type=int, default=150)
+    parser.add_argument("--months", type=int, default=36)
+    parser.add_argument("--late-fees", type=float, nargs="+", default=[0, 50])
+    parser.add_argument("--lease-months", type=int, nargs="+", default=[6, 12])
+    parser.add_argument("--rent-change", type=float, default=0.03)
+    parser.add_argument("--processes", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    scenarios = [
+        Scenario(f"fee{late_fee:g}-lease{lease_months}", args.units, args.tenants, args.months,
+                 late_fee, lease_months, args.rent_change, seed=seed)
+        for seed, (late_fee, lease_months) in enumerate(
+            (fee, months) for fee in args.late_fees for months in args.lease_months
+        )
+    ]
+    start = time.perf_counter()
+    results = run_scenarios(scenarios, args.processes)
+    for result in results:
+        print(format_result(result))
+    print(f"{len(results)} scenario(s) in {time.perf_counter() - start:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+import bisect
+import itertools
+
+
+def normalize_name(name):
+    return " ".join(name.casefold().split())
+
+
+def normalize_phone(phone):
+    return "".join(filter(str.isdigit, phone))
+
+
+def normalize_email(email):
+    return email.strip().lower()
+
+
+class SortedBlocks:
+    """Sorted keys split into short blocks, so an insert or delete shifts one block, not every key.
+
+    Blocks hold at most 2 * load keys; a full block is split in two and an empty
+    one dropped. _maxes holds each block's last key for locating a key's block.
+    """
+
+    def __init__(self, load=500):
+        self._load = load
+        self._blocks = []
+        self._maxes = []
+        self._len = 0
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        return itertools.chain.from_iterable(self._blocks)
+
+    def add(self, key):
+        self._len += 1
+        if not self._blocks:
+            self._blocks.append([key])
+            self._maxes.append(key)
+            return
+        position = bisect.bisect_left(self._maxes, key)
+        if position == len(self._maxes):
+            position -= 1
+            self._blocks[position].append(key)
+            self._maxes[position] = key
+        else:
+            bisect.insort(self._blocks[position], key)
+        block = self._blocks[position]
+        if len(block) > 2 * self._load:
+            tail = block[self._load:]
+            del block[self._load:]
+            self._blocks.insert(position + 1, tail)
+            self._maxes[position] = block[-1]
+            self._maxes.insert(position + 1, tail[-1])
+
+    def remove(self, key):
+        position = bisect.bisect_left(self._maxes, key)
+        if position == len(self._maxes):
+            return
+        block = self._blocks[position]
+        offset = bisect.bisect_left(block, key)
+        if offset == len(block) or block[offset] != key:
+            return
+        del block[offset]
+        self._len -= 1
+        if block:
+            self._maxes[position] = block[-1]
+        else:
+            del self._blocks[position]
+            del self._maxes[position]
+
+    def from_key(self, key):
+        """Yields the keys from key onwards, in order."""
+        position = bisect.bisect_left(self._maxes, key)
+        if position == len(self._blocks):
+            return
+        block = self._blocks[position]
+        yield from itertools.islice(block, bisect.bisect_left(block, key), None)
+        for block in itertools.islice(self._blocks, position + 1, None):
+            yield from block
+
+
+class TenantIndex:
+    """Sorted-prefix index on tenant names plus hash indexes on name, phone and email.
+
+    Tenants are keyed by their id, which also orders tenants sharing a name.
+    """
+
+    def __init__(self):
+        self._keys = {}
+        self._sorted_names = SortedBlocks()
+        self._by_id = {}
+        self._by_name = {}
+        self._by_phone = {}
+        self._by_email = {}
+
+    def add(self, tenant):
+        key = (normalize_name(tenant.name), tenant.id)
+        phone, email = normalize_phone(tenant.phone), normalize_email(tenant.email)
+        self._keys[tenant.id] = (key, phone, email)
+        self._sorted_names.add(key)
+        self._by_id[tenant.id] = tenant
+        self._by_name.setdefault(tenant.name, []).append(tenant)
+        self._by_phone.setdefault(phone, []).append(tenant)
+        self._by_email.setdefault(email, []).append(tenant)
+
+    def remove(self, tenant):
+        entry = self._keys.pop(tenant.id, None)
+        if entry is None:
+            return
+        key, phone, email = entry
+        self._sorted_names.remove(key)
+        del self._by_id[key[1]]
+        self._unlink(self._by_name, tenant.name, tenant)
+        self._unlink(self._by_phone, phone, tenant)
+        self._unlink(self._by_email, email, tenant)
+
+    def by_name(self, name):
+        return list(self._by_name.get(name, ()))
+
+    def by_phone(self, phone):
+        return list(self._by_phone.get(normalize_phone(phone), ()))
+
+    def by_email(self, email):
+        return list(self._by_email.get(normalize_email(email), ()))
+
+    def by_prefix(self, prefix, limit=None):
+        """Returns tenants whose normalized name starts with prefix, in name order."""
+        prefix = normalize_name(prefix)
+        matches = []
+        for name, tenant_id in self._sorted_names.from_key((prefix,)):
+            if not name.startswith(prefix) or (limit is not None and len(matches) >= limit):
+                break
+            matches.append(self._by_id[tenant_id])
+        return matches
+
+    @staticmethod
+    def _unlink(index, key, tenant):
+        bucket = index.get(key)
+        if bucket is None:
+            return
+        bucket.remove(tenant)
+        if not bucket:
+            del index[key]
@@ -0,0 +1,36 @@
+import queue
+import threading
+
+_STOP = object()
+
+
+class WorkerPool:
+    """Hands items to handle() on background threads through a bounded queue.
+
+    put() waits while the queue is full, so a producer faster than the workers
+    is held back instead of piling unhandled items up in memory.
+    """
+
+    def __init__(self, handle, workers=1, max_pending=8):
+        self._handle = handle
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._threads = [threading.Thread(target=self._work, daemon=True) for _ in range(workers)]
+        for thread in self._threads:
+            thread.start()
+
+    def put(self, item):
+        self._queue.put(item)
+
+    def join(self):
+        """Waits for every queued item to be handled and stops the workers."""
+        for _ in self._threads:
+            self._queue.put(_STOP)
+        for thread in self._threads:
+            thread.join()
+
+    def _work(self):
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            self._handle(item)
@@ -0,0 +1,74 @@
+"""Startup-time benchmark for the CLI and for lazily hydrated entities.
+
+Run from the repository root:
+
+    python benchmarks/startup.py [runs]
+"""
+import functools
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def exit_choice():
+    """The menu number of Exit, read from the CLI so renumbering the menu cannot break the benchmark."""
+    from main import MENU
+
+    return next(line.split(".")[0] for line in MENU.splitlines() if line.endswith(". Exit"))
+
+
+def time_cli_launch(runs):
+    """Launches main.py and exits straight away, as a cron job would."""
+    choice = exit_choice()
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, os.path.join(ROOT, "main.py")],
+            input=f"{choice}\n", capture_output=True, text=True, check=True, cwd=ROOT,
+        )
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def _load_payments(tenant_number, payments):
+    """Stands in for reading one tenant's payment rows from storage."""
+    return [{"amount": 100 + tenant_number % 7, "date": f"2024-{month % 12 + 1:02d}-01"}
+            for month in range(payments)]
+
+
+def time_hydration(tenants, payments):
+    from apartment_manager.apartment_manager import ApartmentManager
+
+    start = time.perf_counter()
+    eager = ApartmentManager()
+    for i in range(tenants):
+        tenant = eager.add_tenant(f"Tenant {i}", str(i), f"t{i}@example.com")
+        tenant.payment_history = _load_payments(i, payments)
+    eager_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    lazy = ApartmentManager()
+    for i in range(tenants):
+        lazy.add_tenant(f"Tenant {i}", str(i), f"t{i}@example.com",
+                        payment_loader=functools.partial(_load_payments, i, payments))
+    lazy_seconds = time.perf_counter() - start
+    return eager_seconds, lazy_seconds
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    samples = time_cli_launch(runs)
+    print(f"CLI launch ({runs} runs): median {statistics.median(samples) * 1000:.1f} ms, "
+          f"min {min(samples) * 1000:.1f} ms")
+    eager_seconds, lazy_seconds = time_hydration(50000, 24)
+    print(f"Load 50000 tenants x 24 payments: eager {eager_seconds:.3f} s, lazy {lazy_seconds:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,39 +1,57 @@
 from apartment_manager.apartment_manager import ApartmentManager
 
+MENU = "\n".join([
+    "\nApartment Management System",
+    "1. Add Apartment",
+    "2. Add Tenant",
+    "3. Lease Apartment",
+    "4. Search Apartments",
+    "5. List Apartments",
+    "6. List Tenants",
+    "7. List Leases",
+    "8. Make Payment",
+    "9. Submit Maintenance Request",
+    "10. View Overdue Payments",
+    "11. Terminate Lease",
+    "12. Generate Lease Summary",
+    "13. View Maintenance Requests",
+    "14. Generate Monthly Report",
+    "15. Filter Tenants by Balance",
+    "16. Apartment Occupancy Report",
+    "17. View Tenant Profile",
+    "18. Assign Maintenance Staff",
+    "19. Apply Late Fees",
+    "20. Extend Lease",
+    "21. Track Maintenance Status",
+    "22. Track Overdue Leases",
+    "23. Generate Outstanding Payment Report",
+    "24. Calculate Average Rent",
+    "25. Delete Apartment",
+    "26. Delete Tenant",
+    "27. Project Monthly Revenue",
+    "28. Search Tenants",
+    "29. Export Change Feed",
+    "30. Delinquency Aging Report",
+    "31. Find Vacant Units",
+    "32. Send Reminders",
+    "33. Update Maintenance Request Status",
+    "34. Maintenance SLA Dashboard",
+    "35. Export Report",
+    "36. Exit",
+])
+
+
 def main():
     manager = ApartmentManager()
 
     while True:
-        print("\nApartment Management System")
-        print("1. Add Apartment")
-        print("2. Add Tenant")
-        print("3. Lease Apartment")
-        print("4. Search Apartments")
-        print("5. List Apartments")
-        print("6. List Tenants")
-        print("7. List Leases")
-        print("8. Make Payment")
-        print("9. Submit Maintenance Request")
-        print("10. View Overdue Payments")
-        print("11. Terminate Lease")
-        print("12. Generate Lease Summary")
-        print("13. View Maintenance Requests")
-        print("14. Generate Monthly Report")
-        print("15. Filter Tenants by Balance")
-        print("16. Apartment Occupancy Report")
-        print("17. View Tenant Profile")
-        print("18. Assign Maintenance Staff")
-        print("19. Apply Late Fees")
-        print("20. Extend Lease")
-        print("21. Track Maintenance Status")
-        print("22. Track Overdue Leases")
-        print("23. Generate Outstanding Payment Report")
-        print("24. Calculate Average Rent")
-        print("25. Delete Apartment")
-        print("26. Delete Tenant")
-        print("27. Exit")
+        print(MENU)
 
-        choice = input("Enter your choice: ")
+        try:
+            choice = input("Enter your choice: ")
+        except EOFError:
+            print("\nExiting...")
+            break
         if choice == "1":
             unit_number = input("Enter unit number: ")
             bedrooms = int(input("Enter number of bedrooms: "))
@@ -62,14 +80,14 @@ def main():
             max_rent = input("Enter maximum rent (or press Enter to skip): ")
             bedrooms = input("Enter bedrooms (or press Enter to skip): ")
             bathrooms = input("Enter bathrooms (or press Enter to skip): ")
-            apartments = manager.search_apartments(
+            apartments = manager.find_apartments(
                 min_rent=float(min_rent) if min_rent else None,
                 max_rent=float(max_rent) if max_rent else None,
                 bedrooms=int(bedrooms) if bedrooms else None,
                 bathrooms=int(bathrooms) if bathrooms else None,
             )
             print("\nAvailable Apartments:")
-            print("\n".join(apartments))
+            print("\n".join(map(str, apartments)) if apartments else "No apartments match the search criteria.")
         elif choice == "5":
             print("\nApartments:")
             print("\n".join(manager.list_apartments()))
@@ -82,32 +100,18 @@ def main():
         elif choice == "8":
             tenant_name = input("Enter tenant name: ")
             amount = float(input("Enter payment amount: "))
-            tenant = next((t for t in manager.tenants if t.name == tenant_name), None)
-            if tenant:
-                print(tenant.make_payment(amount))
-            else:
-                print("Tenant not found.")
+            print(manager.make_payment(tenant_name, amount))
         elif choice == "9":
             unit_number = input("Enter apartment unit number: ")
             request = input("Enter maintenance request details: ")
-            apartment = next((a for a in manager.apartments if a.unit_number == unit_number), None)
-            if apartment:
-                apartment.add_maintenance_request(request)
-                print("Maintenance request submitted.")
-            else:
-                print("Apartment not found.")
+            print(manager.submit_maintenance_request(unit_number, request))
         elif choice == "10":
             overdue = manager.overdue_payments()
             print("\nOverdue Payments:")
             print("\n".join(overdue) if overdue else "No overdue payments.")
         elif choice == "11":
             unit_number = input("Enter apartment unit number: ")
-            lease = next((l for l in manager.leases if l.apartment.unit_number == unit_number), None)
-            if lease:
-                print(lease.terminate_lease())
-                manager.leases.remove(lease)
-            else:
-                print("Lease not found.")
+            print(manager.terminate_lease(unit_number))
         elif choice == "12":
             unit_number = input("Enter apartment unit number: ")
             print(manager.generate_lease_summary(unit_number))
@@ -117,15 +121,17 @@ def main():
         elif choice == "14":
             year = int(input("Enter year (YYYY): "))
             month = int(input("Enter month (MM): "))
-            print(manager.generate_monthly_report(year, month))
+            print(manager.monthly_report(year, month))
         elif choice == "15":
             threshold = float(input("Enter balance threshold: "))
             print("\n".join(manager.filter_tenants_by_balance(threshold)))
         elif choice == "16":
-            print(manager.apartment_occupancy_report())
+            as_of = input("Enter date (YYYY-MM-DD, or press Enter for current status): ")
+            print(manager.occupancy(as_of or None))
         elif choice == "17":
             tenant_name = input("Enter tenant name: ")
-            print(manager.view_tenant_profile(tenant_name))
+            profile = manager.tenant_profile(tenant_name)
+            print(profile if profile else "Tenant not found.")
         elif choice == "18":
             unit_number = input("Enter apartment unit number: ")
             staff_name = input("Enter staff name: ")
@@ -144,7 +150,7 @@ def main():
         elif choice == "23":
             print(manager.generate_outstanding_report())
         elif choice == "24":
-            print(manager.calculate_average_rent())
+            print(f"The average rent of all apartments is ${manager.average_rent():.2f}.")
         elif choice == "25":
             unit_number = input("Enter unit number to delete: ")
             print(manager.delete_apartment(unit_number))
@@ -152,6 +158,57 @@ def main():
             tenant_name = input("Enter tenant name to delete: ")
             print(manager.delete_tenant(tenant_name))
         elif choice == "27":
+            start_date = input("Enter projection start date (YYYY-MM-DD): ")
+            end_date = input("Enter projection end date (YYYY-MM-DD): ")
+            for month, revenue in manager.project_monthly_revenue(start_date, end_date):
+                print(f"{month:%Y-%m}: ${revenue:.2f}")
+        elif choice == "28":
+            prefix = input("Enter name prefix (or press Enter to skip): ")
+            phone = input("Enter phone (or press Enter to skip): ")
+            email = input("Enter email (or press Enter to skip): ")
+            tenants = manager.search_tenants(
+                prefix=prefix or None,
+                phone=phone or None,
+                email=email or None,
+            )
+            print("\n".join(str(t) for t in tenants) if tenants else "No tenants found.")
+        elif choice == "29":
+            since = input("Export changes after sequence number (or press Enter for all): ")
+            path = input("Enter output file (JSONL): ")
+            with open(path, "a") as stream:
+                last_seq = manager.export_changes(stream, int(since) if since else 0)
+            print(f"Exported changes through sequence {last_seq}.")
+        elif choice == "30":
+            as_of = input("Enter as-of date (YYYY-MM-DD, or press Enter for today): ")
+            print(manager.delinquency_report(as_of or None))
+        elif choice == "31":
+            start_date = input("Enter window start date (YYYY-MM-DD): ")
+            end_date = input("Enter window end date (YYYY-MM-DD): ")
+            units = manager.vacant_units(start_date, end_date)
+            print("\n".join(f"Unit {unit}" for unit in units) if units else "No vacant units in that window.")
+        elif choice == "32":
+            from apartment_manager.notifications import FileSink
+
+            path = input("Enter reminder output file: ")
+            within_days = input("Remind about leases ending within how many days (default 30): ")
+            print(manager.send_reminders(FileSink(path), within_days=int(within_days) if within_days else 30))
+        elif choice == "33":
+            unit_number = input("Enter apartment unit number: ")
+            index = int(input("Enter request number (starting at 0): "))
+            status = input("Enter new status (e.g. In Progress, Completed): ")
+            print(manager.update_maintenance_status(unit_number, index, status))
+        elif choice == "34":
+            print(manager.maintenance_dashboard())
+        elif choice == "35":
+            dataset = input("Enter dataset (leases, payments, tenants): ")
+            fmt = input("Enter format (csv, jsonl, columnar; default csv): ") or "csv"
+            path = input("Enter output file: ")
+            compress = input("Compress with gzip? (y/n): ").strip().lower() == "y"
+            try:
+                print(manager.export_report(dataset, path, fmt, compress))
+            except ValueError as e:
+                print(e)
+        elif choice == "36":
             print("Exiting...")
             break
         else:
@@ -0,0 +1,105 @@
+import unittest
+from datetime import date
+from apartment_manager.aging import AgingLedger
+from apartment_manager.apartment_manager import ApartmentManager
+
+
+class TestAgingLedger(unittest.TestCase):
+
+    def setUp(self):
+        self.ledger = AgingLedger()
+
+    def test_payments_apply_to_oldest_charge_first(self):
+        self.ledger.charge("alice", 1000, date(2024, 1, 1))
+        self.ledger.charge("alice", 1000, date(2024, 2, 1))
+        self.ledger.charge("alice", 1000, date(2024, 3, 1))
+        self.ledger.pay("alice", 1500, date(2024, 3, 5))
+        buckets = self.ledger.buckets(date(2024, 4, 15), "alice")
+        self.assertEqual(buckets, {"0-30": 0, "31-60": 1000, "61-90": 500, "90+": 0})
+        self.assertEqual(self.ledger.outstanding("alice"), 1500)
+
+    def test_overpayment_becomes_credit(self):
+        self.ledger.charge("bob", 100, date(2024, 1, 1))
+        self.ledger.pay("bob", 250, date(2024, 1, 5))
+        self.assertEqual(self.ledger.report(date(2024, 6, 1)), [])
+        self.ledger.charge("bob", 100, date(2024, 2, 1))
+        self.ledger.charge("bob", 100, date(2024, 3, 1))
+        self.assertEqual(self.ledger.outstanding("bob"), 50)
+
+    def test_entries_after_as_of_are_ignored(self):
+        self.ledger.charge("alice", 1000, date(2024, 1, 1))
+        self.ledger.charge("alice", 1000, date(2030, 1, 1))
+        self.ledger.pay("alice", 600, date(2024, 3, 1))
+        self.ledger.pay("alice", 400, date(2024, 6, 1))
+        self.assertEqual(self.ledger.buckets(date(2024, 4, 1)),
+                         {"0-30": 0, "31-60": 0, "61-90": 0, "90+": 400})
+        self.assertEqual(self.ledger.buckets(date(2024, 7, 1), "alice"),
+                         {"0-30": 0, "31-60": 0, "61-90": 0, "90+": 0})
+        self.assertEqual(self.ledger.report(date(2024, 7, 1)), [])
+        self.assertEqual(self.ledger.outstanding("alice"), 1000)
+        self.assertEqual(self.ledger.buckets(date(2030, 2, 1)),
+                         {"0-30": 0, "31-60": 1000, "61-90": 0, "90+": 0})
+
+    def test_back_dated_charge_is_paid_first(self):
+        self.ledger.charge("bob", 100, date(2024, 3, 1))
+        self.ledger.pay("bob", 100, date(2024, 3, 2))
+        self.ledger.charge("bob", 100, date(2024, 1, 1))
+        self.assertEqual(self.ledger.buckets(date(2024, 4, 1), "bob"),
+                         {"0-30": 0, "31-60": 100, "61-90": 0, "90+": 0})
+        self.ledger.pay("bob", 150, date(2024, 4, 2))
+        self.ledger.charge("bob", 100, date(2024, 5, 1))
+        self.assertEqual(self.ledger.outstanding("bob"), 50)
+
+    def test_portfolio_buckets_and_removal(self):
+        self.ledger.charge("alice", 300, date(2024, 1, 1))
+        self.ledger.charge("bob", 200, date(2024, 1, 1))
+        self.ledger.charge("bob", 100, date(2024, 5, 20))
+        self.assertEqual(self.ledger.buckets(date(2024, 6, 1)),
+                         {"0-30": 100, "31-60": 0, "61-90": 0, "90+": 500})
+        self.ledger.remove_tenant("bob")
+        self.assertEqual(self.ledger.buckets(date(2024, 6, 1)),
+                         {"0-30": 0, "31-60": 0, "61-90": 0, "90+": 300})
+        self.assertEqual([row.tenant for row in self.ledger.report(date(2024, 6, 1))], ["alice"])
+
+
+class TestDelinquencyReport(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = ApartmentManager()
+        self.manager.add_apartment("101", 2, 1, 1500)
+        self.manager.add_apartment("102", 3, 2, 2000)
+        self.manager.add_tenant("Alice", "1234567890", "alice@example.com")
+        self.manager.add_tenant("Bob", "9876543210", "bob@example.com")
+
+    def test_report(self):
+        self.manager.lease_apartment("Alice", "101", "2024-01-01", "2024-12-31")
+        self.manager.lease_apartment("Bob", "102", "2024-03-15", "2024-12-31")
+        self.manager.post_payments([("Bob", 500, "2024-03-20"), ("Alice", 1500, "2024-04-02")])
+        report = self.manager.delinquency_report("2024-03-31").splitlines()
+        self.assertEqual(report[0], "Aging as of 2024-03-31")
+        self.assertEqual(report[1], "Alice: 0-30: $0, 31-60: $0, 61-90: $1500, 90+: $0, Total: $1500")
+        self.assertEqual(report[2], "Bob: 0-30: $1500, 31-60: $0, 61-90: $0, 90+: $0, Total: $1500")
+        self.assertEqual(report[3], "All tenants: 0-30: $1500, 31-60: $0, 61-90: $1500, 90+: $0, Total: $3000")
+
+    def test_fees_can_be_dated(self):
+        self.manager.apply_fees(["Alice"], 100, "2024-01-01")
+        self.manager.apply_late_fees(25, "2024-03-01")
+        buckets = self.manager.aging.buckets(date(2024, 4, 15), self.manager.find_tenant("Alice").id)
+        self.assertEqual(buckets, {"0-30": 0, "31-60": 25, "61-90": 0, "90+": 100})
+
+    def test_entity_payments_reach_the_ledger(self):
+        lease = self.manager.lease_apartment("Alice", "101", "2024-01-01", "2024-12-31")
+        lease.add_payment(1500, "2024-01-05")
+        self.manager.lease_apartment("Bob", "102", "2024-01-01", "2024-12-31")
+        self.manager.find_tenant("Bob").make_payment(2000, "2024-01-10")
+        self.assertEqual(self.manager.generate_outstanding_report(), "No outstanding balances found.")
+        self.assertEqual(self.manager.delinquency_report(), "No outstanding balances found.")
+        self.assertIn("Alice: 0-30: $1500", self.manager.delinquency_report("2024-01-02"))
+
+    def test_payments_and_deletes_clear_the_report(self):
+        self.manager.lease_apartment("Alice", "101", "2024-01-01", "2024-12-31")
+        self.manager.make_payment("Alice", 1500)
+        self.assertEqual(self.manager.delinquency_report(), "No outstanding balances found.")
+        self.manager.apply_fees(["Bob"], 50)
+        self.manager.delete_tenant("Bob")
+        self.assertEqual(self.manager.delinquency_report(), "No outstanding balances found.")
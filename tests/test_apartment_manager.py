@@ -1,5 +1,5 @@
 import unittest
-from datetime import date
+from datetime import date, timedelta
 from apartment_manager.apartment_manager import ApartmentManager, Apartment, Tenant, Lease
 
 
@@ -20,6 +20,11 @@ class TestApartmentManager(unittest.TestCase):
         # Create a lease
         self.manager.lease_apartment("Alice", "101", "2023-01-01", "2023-12-31")
 
+    def _lease_101_through_today(self):
+        """The setUp lease ended in 2023; units only count as occupied while a lease covers today."""
+        today = date.today()
+        self.manager.lease_apartment("Alice", "101", today - timedelta(days=30), today + timedelta(days=335))
+
     def test_add_apartment(self):
         self.manager.add_apartment("103", 1, 1, 1200)
         apartment = next((a for a in self.manager.apartments if a.unit_number == "103"), None)
@@ -32,7 +37,7 @@ class TestApartmentManager(unittest.TestCase):
         self.assertEqual(tenant.name, "Charlie")
 
     def test_lease_apartment(self):
-        lease = self.manager.lease_apartment("Bob", "102", "2023-01-01", "2023-12-31")
+        lease = self.manager.lease_apartment("Bob", "102", date.today(), date.today() + timedelta(days=365))
         self.assertEqual(lease.tenant.name, "Bob")
         self.assertFalse(lease.apartment.is_available)
 
@@ -86,6 +91,7 @@ class TestApartmentManager(unittest.TestCase):
         self.assertIn("Alice", results[0])
 
     def test_apartment_occupancy_report(self):
+        self._lease_101_through_today()
         report = self.manager.apartment_occupancy_report()
         self.assertIn("Total Apartments: 2", report)
         self.assertIn("Occupied Apartments: 1", report)
@@ -141,6 +147,7 @@ class TestApartmentManager(unittest.TestCase):
         self.assertEqual(profile, "Tenant not found.")
 
     def test_search_apartments(self):
+        self._lease_101_through_today()
 
         # Test case 2: Search by minimum rent
         results = self.manager.search_apartments(min_rent=1800)
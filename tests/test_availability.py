@@ -0,0 +1,104 @@
+import unittest
+from datetime import date, timedelta
+from apartment_manager.apartment_manager import Apartment, ApartmentManager, Lease, Tenant
+from apartment_manager.bulk import BulkOperationError
+
+
+class TestAvailabilityCalendar(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = ApartmentManager()
+        self.manager.add_apartment("101", 2, 1, 1500)
+        self.manager.add_tenant("Alice", "1234567890", "alice@example.com")
+        self.manager.add_tenant("Bob", "9876543210", "bob@example.com")
+        self.manager.lease_apartment("Alice", "101", "2024-01-01", "2024-06-30")
+
+    def test_future_lease_can_follow_current_one(self):
+        lease = self.manager.lease_apartment("Bob", "101", "2024-07-01", "2025-06-30")
+        self.assertEqual([l.tenant.name for l in self.manager.bookings("101")], ["Alice", "Bob"])
+        self.assertEqual(lease.start_date.isoformat(), "2024-07-01")
+
+    def test_overlapping_lease_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.manager.lease_apartment("Bob", "101", "2024-06-30", "2024-12-31")
+        with self.assertRaises(ValueError):
+            self.manager.lease_apartment("Bob", "101", "2023-12-01", "2024-01-01")
+        with self.assertRaises(ValueError):
+            self.manager.lease_apartment("Bob", "101", "2024-12-31", "2024-07-01")
+        self.assertEqual(len(self.manager.leases), 1)
+
+    def test_availability_on_date(self):
+        self.manager.lease_apartment("Bob", "101", "2024-09-01", "2024-12-31")
+        self.assertFalse(self.manager.available_on("101", "2024-06-30"))
+        self.assertTrue(self.manager.available_on("101", "2024-08-15"))
+        self.assertFalse(self.manager.available_on("101", "2024-09-01"))
+        with self.assertRaises(ValueError):
+            self.manager.available_on("999", "2024-01-01")
+
+    def test_extension_cannot_run_into_next_booking(self):
+        today = date.today()
+        self.manager.lease_apartment("Alice", "101", today, today + timedelta(days=30))
+        booked = today + timedelta(days=60)
+        self.manager.lease_apartment("Bob", "101", booked, booked + timedelta(days=90))
+        message = self.manager.extend_lease("101", booked + timedelta(days=14))
+        self.assertEqual(message, f"Cannot extend lease for Unit 101: unit is booked from {booked}.")
+        self.assertIn("extended", self.manager.extend_lease("101", booked - timedelta(days=1)))
+
+    def test_lease_cannot_be_cut_back_before_its_start(self):
+        message = self.manager.extend_lease("101", "2023-12-31")
+        self.assertEqual(message, "Cannot extend lease for Unit 101: 2023-12-31 is before the lease start 2024-01-01.")
+        self.assertEqual(self.manager.occupancy("2024-03-01").occupied_units, 1)
+        self.assertEqual(self.manager.occupancy("2023-12-31").occupied_units, 0)
+
+    def test_availability_follows_the_lease_covering_today(self):
+        today = date.today()
+        # The setUp lease ended in 2024, so the unit is free today without being terminated.
+        self.assertTrue(self.manager.find_apartment("101").is_available)
+        self.manager.lease_apartment("Bob", "101", today + timedelta(days=200), today + timedelta(days=500))
+        self.assertTrue(self.manager.find_apartment("101").is_available)
+        self.assertEqual(len(self.manager.search_apartments()), 1)
+        self.assertEqual(self.manager.occupancy().occupied_units, 0)
+        self.manager.lease_apartment("Alice", "101", today - timedelta(days=10), today + timedelta(days=10))
+        self.assertFalse(self.manager.find_apartment("101").is_available)
+        self.assertEqual(self.manager.search_apartments(), ["No apartments match the search criteria."])
+        self.assertEqual(self.manager.occupancy().occupied_units, 1)
+        self.manager.terminate_lease("101")
+        self.assertTrue(self.manager.find_apartment("101").is_available)
+        self.assertFalse(self.manager.available_on("101", today + timedelta(days=200)))
+
+    def test_current_lease_falls_back_to_the_next_booking(self):
+        for order in ((0, 1), (1, 0)):
+            manager = ApartmentManager()
+            manager.add_apartment("101", 2, 1, 1500)
+            manager.add_tenant("Alice", "1234567890", "alice@example.com")
+            bookings = [("2023-01-01", "2023-12-31"), ("2030-01-01", "2030-12-31")]
+            for position in order:
+                manager.lease_apartment("Alice", "101", *bookings[position])
+            self.assertIn("Lease Period: 2030-01-01 to 2030-12-31", manager.generate_lease_summary("101"))
+            self.assertIn("extended from 2030-12-31", manager.extend_lease("101", "2031-06-30"))
+            manager.terminate_lease("101")
+            self.assertEqual([l.start_date.isoformat() for l in manager.bookings("101")], ["2023-01-01"])
+            self.assertIn("Lease Period: 2023-01-01", manager.generate_lease_summary("101"))
+
+    def test_terminating_a_standalone_lease_frees_the_unit(self):
+        today = date.today()
+        apartment = Apartment("201", 1, 1, 900)
+        lease = Lease(Tenant("Carol", "5550000000", "carol@example.com"), apartment,
+                      today - timedelta(days=1), today + timedelta(days=1))
+        self.assertFalse(apartment.is_available)
+        lease.terminate_lease()
+        self.assertTrue(apartment.is_available)
+        self.assertEqual(lease.tenant.leases, {})
+
+    def test_bulk_bookings_check_the_calendar_and_each_other(self):
+        results = self.manager.create_leases([
+            ("Bob", "101", "2024-07-01", "2024-09-30"),
+            ("Alice", "101", "2024-10-01", "2024-12-31"),
+        ])
+        self.assertEqual(len(results), 2)
+        with self.assertRaises(BulkOperationError):
+            self.manager.create_leases([
+                ("Bob", "101", "2025-01-01", "2025-03-31"),
+                ("Alice", "101", "2025-03-01", "2025-06-30"),
+            ])
+        self.assertEqual(len(self.manager.bookings("101")), 3)
@@ -0,0 +1,59 @@
+import unittest
+from datetime import date
+from apartment_manager.apartment_manager import ApartmentManager
+from apartment_manager.bulk import BulkOperationError, PaymentResult
+
+
+class TestBulkOperations(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = ApartmentManager()
+        self.manager.add_apartment("101", 2, 1, 1500)
+        self.manager.add_apartment("102", 3, 2, 2000)
+        self.manager.add_tenant("Alice", "1234567890", "alice@example.com")
+        self.manager.add_tenant("Bob", "9876543210", "bob@example.com")
+
+    def test_post_payments(self):
+        results = self.manager.post_payments([
+            ("Alice", 100),
+            ("Bob", 50, "2024-02-01"),
+            ("Alice", 25, date(2024, 3, 1)),
+        ])
+        self.assertEqual(results[1], PaymentResult("Bob", 50, date(2024, 2, 1), -50))
+        self.assertEqual(results[2].balance_due, -125)
+        self.assertEqual(len(self.manager.find_tenant("Alice").payment_history), 2)
+
+    def test_post_payments_is_all_or_nothing(self):
+        with self.assertRaises(BulkOperationError) as context:
+            self.manager.post_payments([("Alice", 100), ("Nobody", 10), ("Bob", -5)])
+        self.assertEqual([position for position, _ in context.exception.errors], [1, 2])
+        self.assertEqual(self.manager.find_tenant("Alice").balance_due, 0)
+        self.assertEqual(self.manager.find_tenant("Alice").payment_history, [])
+
+    def test_create_leases(self):
+        results = self.manager.create_leases([
+            ("Alice", "101", "2024-01-01", "2024-12-31"),
+            ("Bob", "102", "2024-02-01", "2025-01-31"),
+        ])
+        self.assertEqual([r.unit_number for r in results], ["101", "102"])
+        self.assertEqual(results[1].balance_due, 2000)
+        self.assertEqual(len(self.manager.leases), 2)
+        self.assertFalse(self.manager.available_on("102", "2024-06-01"))
+
+    def test_create_leases_rejects_conflicts_without_side_effects(self):
+        with self.assertRaises(BulkOperationError):
+            self.manager.create_leases([
+                ("Alice", "101", "2024-01-01", "2024-12-31"),
+                ("Bob", "101", "2024-01-01", "2024-12-31"),
+            ])
+        with self.assertRaises(ValueError):
+            self.manager.create_leases([("Alice", "102", "2024-12-31", "2024-01-01")])
+        self.assertEqual(self.manager.leases, [])
+        self.assertTrue(self.manager.find_apartment("101").is_available)
+
+    def test_apply_fees(self):
+        results = self.manager.apply_fees(["Alice", "Bob"], 35)
+        self.assertEqual([r.balance_due for r in results], [35, 35])
+        with self.assertRaises(BulkOperationError):
+            self.manager.apply_fees(["Alice", "Nobody"], 35)
+        self.assertEqual(self.manager.find_tenant("Alice").balance_due, 35)
@@ -0,0 +1,56 @@
+import unittest
+from apartment_manager.apartment_manager import ApartmentManager
+
+
+class TestCascadingDelete(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = ApartmentManager()
+        self.manager.add_apartment("101", 2, 1, 1500)
+        self.manager.add_apartment("102", 3, 2, 2000)
+        self.manager.add_tenant("Alice", "1234567890", "alice@example.com")
+        self.manager.add_tenant("Bob", "9876543210", "bob@example.com")
+        self.manager.lease_apartment("Alice", "101", "2023-01-01", "2023-12-31")
+        self.manager.lease_apartment("Bob", "102", "2023-01-01", "2023-12-31")
+
+    def test_delete_tenant_cascades_to_leases(self):
+        self.assertEqual(self.manager.delete_tenant("Alice"), "Tenant Alice deleted.")
+        self.assertEqual([l.tenant.name for l in self.manager.leases], ["Bob"])
+        apartment = self.manager.find_apartment("101")
+        self.assertEqual(apartment.leases, {})
+        self.assertTrue(apartment.is_available)
+        self.assertEqual(self.manager.generate_lease_summary("101"),
+                         "No active lease found for the specified unit number.")
+
+    def test_delete_apartment_cascades_to_leases_and_maintenance(self):
+        self.manager.submit_maintenance_request("101", "Fix the heater")
+        alice = self.manager.find_tenant("Alice")
+        self.manager.delete_apartment("101")
+        self.assertEqual(alice.leases, {})
+        self.assertEqual(len(self.manager.leases), 1)
+        self.assertIn("Leases:\n", self.manager.view_tenant_profile("Alice"))
+        self.assertNotIn("101", self.manager.get_maintenance_summary())
+
+    def test_reject_policy_leaves_everything_in_place(self):
+        message = self.manager.delete_tenant("Alice", on_delete="reject")
+        self.assertEqual(message, "Tenant Alice has active leases.")
+        with self.assertRaises(ValueError):
+            self.manager.delete_apartments(["102", "101"], on_delete="reject")
+        self.assertEqual(len(self.manager.apartments), 2)
+        self.assertEqual(len(self.manager.leases), 2)
+
+        self.manager.terminate_lease("101")
+        self.assertEqual(self.manager.delete_apartment("101", on_delete="reject"),
+                         "Apartment Unit 101 deleted.")
+
+    def test_batch_delete(self):
+        for i in range(200):
+            self.manager.add_tenant(f"T{i}", str(i), f"t{i}@example.com")
+        deleted = self.manager.delete_tenants([f"T{i}" for i in range(0, 200, 2)] + ["Bob"])
+        self.assertEqual(len(deleted), 101)
+        self.assertEqual(len(self.manager.tenants), 101)
+        self.assertEqual(len(self.manager.leases), 1)
+        self.assertTrue(self.manager.find_apartment("102").is_available)
+        with self.assertRaises(ValueError):
+            self.manager.delete_tenants(["T1", "Nobody"])
+        self.assertIsNotNone(self.manager.find_tenant("T1"))
@@ -0,0 +1,60 @@
+import io
+import json
+import unittest
+from apartment_manager.apartment_manager import ApartmentManager
+
+
+class TestChangeFeed(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = ApartmentManager()
+        self.manager.add_apartment("101", 2, 1, 1500)
+        self.manager.add_tenant("Alice", "1234567890", "alice@example.com")
+
+    def test_mutations_are_sequence_numbered(self):
+        self.manager.lease_apartment("Alice", "101", "2024-01-01", "2024-12-31")
+        self.manager.make_payment("Alice", 500)
+        changes = self.manager.changes.since(0)
+        self.assertEqual([c.seq for c in changes], [1, 2, 3, 4])
+        self.assertEqual([(c.entity, c.op) for c in changes], [
+            ("apartment", "add"), ("tenant", "add"), ("lease", "add"), ("payment", "add"),
+        ])
+        self.assertEqual(changes[3].data["balance_due"], 1000)
+
+    def test_lease_payments_are_recorded(self):
+        self.manager.lease_apartment("Alice", "101", "2024-01-01", "2024-12-31")
+        lease = self.manager.leases[0]
+        lease.add_payment(400, "2024-02-01")
+        change = self.manager.changes.since(0)[-1]
+        self.assertEqual((change.entity, change.op, change.key), ("payment", "add", "Alice"))
+        self.assertEqual(change.data["lease"], lease.id)
+        self.assertEqual(change.data["amount"], 400)
+        self.assertEqual(change.data["balance_due"], 1100)
+
+    def test_since_returns_only_the_delta(self):
+        checkpoint = self.manager.changes.last_seq
+        self.manager.apply_late_fees(50)
+        self.assertEqual(self.manager.changes.since(checkpoint), [])
+        self.manager.apply_fees(["Alice"], 25)
+        self.manager.delete_tenant("Alice")
+        delta = self.manager.changes.since(checkpoint)
+        self.assertEqual([(c.entity, c.op, c.key) for c in delta], [
+            ("tenant", "update", "Alice"), ("tenant", "delete", "Alice"),
+        ])
+
+    def test_export_jsonl(self):
+        self.manager.lease_apartment("Alice", "101", "2024-01-01", "2024-12-31")
+        stream = io.StringIO()
+        last_seq = self.manager.export_changes(stream, since=2)
+        rows = [json.loads(line) for line in stream.getvalue().splitlines()]
+        self.assertEqual(last_seq, 3)
+        self.assertEqual(rows[0]["seq"], 3)
+        self.assertEqual(rows[0]["data"]["start_date"], "2024-01-01")
+
+    def test_discarded_changes_cannot_be_replayed(self):
+        self.manager.changes.discard_through(1)
+        self.assertEqual([c.seq for c in self.manager.changes.since(1)], [2])
+        with self.assertRaises(ValueError):
+            self.manager.changes.since(0)
+        self.manager.add_tenant("Bob", "9876543210", "bob@example.com")
+        self.assertEqual(self.manager.changes.last_seq, 3)
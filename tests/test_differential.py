@@ -0,0 +1,41 @@
+import random
+import unittest
+from apartment_manager.apartment_manager import ApartmentManager
+from apartment_manager.differential import format_report, generate_operations, run_seed, run_seeds
+
+
+class VacancyBlindManager(ApartmentManager):
+    def vacant_units(self, start_date, end_date):
+        return [apartment.unit_number for apartment in self.apartments]
+
+
+class TestDifferentialHarness(unittest.TestCase):
+
+    def test_generation_is_deterministic(self):
+        first = generate_operations(random.Random(7), 200, units=10, tenants=10)
+        self.assertEqual(first, generate_operations(random.Random(7), 200, units=10, tenants=10))
+        self.assertEqual(len(first), 210)
+
+    def test_manager_matches_reference(self):
+        for seed in range(3):
+            result = run_seed(seed, steps=400, units=12, tenants=16)
+            self.assertIsNone(result.mismatch, result.mismatch)
+            self.assertEqual(result.steps, 414)
+
+    def test_divergence_is_reported(self):
+        result = run_seed(0, steps=400, units=12, tenants=16, factory=VacancyBlindManager)
+        self.assertIsNotNone(result.mismatch)
+        self.assertEqual(result.mismatch.operation[0], "vacant")
+        self.assertIn("MISMATCH", format_report([result]))
+
+    def test_seeds_run_in_worker_processes(self):
+        results = run_seeds([3, 4], steps=200, units=10, tenants=12, processes=2)
+        self.assertEqual([result.seed for result in results], [3, 4])
+        self.assertTrue(all(result.mismatch is None for result in results))
+        report = format_report(results)
+        self.assertIn("2/2 seed(s) matched the reference", report)
+        self.assertIn("speedup", report)
+
+
+if __name__ == '__main__':
+    unittest.main()
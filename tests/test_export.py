@@ -0,0 +1,101 @@
+import csv
+import gzip
+import io
+import itertools
+import json
+import os
+import tempfile
+import unittest
+from apartment_manager.apartment_manager import ApartmentManager
+from apartment_manager.export import ExportPipeline, export, read_columnar
+from apartment_manager.lazy import is_loaded
+
+
+class FailingStream:
+    def write(self, data):
+        raise OSError("disk full")
+
+
+class TestExport(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = ApartmentManager()
+        self.manager.add_apartment("101", 2, 1, 1500)
+        self.manager.add_apartment("102", 1, 1, 1000)
+        self.manager.add_tenant("Alice", "1234567890", "alice@example.com")
+        self.manager.add_tenant("Bob", "9876543210", "bob@example.com")
+        lease = self.manager.lease_apartment("Alice", "101", "2024-01-01", "2024-12-31")
+        self.manager.lease_apartment("Bob", "102", "2024-02-01", "2024-12-31")
+        lease.add_payment(1500, "2024-01-05")
+        self.manager.post_payments([("Bob", 400, "2024-02-03"), ("Bob", 600, "2024-03-03")])
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def test_csv_leases(self):
+        message = self.manager.export_report("leases", self.path("leases.csv"))
+        self.assertEqual(message, f"Exported 2 leases row(s) to {self.path('leases.csv')}.")
+        with open(self.path("leases.csv"), newline="") as stream:
+            rows = list(csv.reader(stream))
+        self.assertEqual(rows[0], ["lease_id", "tenant", "unit_number", "start_date", "end_date", "payments", "paid"])
+        self.assertEqual(rows[1], ["0", "Alice", "101", "2024-01-01", "2024-12-31", "1", "1500"])
+
+    def test_gzipped_jsonl_payments_in_small_chunks(self):
+        rows = export(self.manager, "payments", self.path("payments.jsonl.gz"), "jsonl", compress=True, chunk_rows=1)
+        self.assertEqual(rows, 3)
+        with gzip.open(self.path("payments.jsonl.gz"), "rt") as stream:
+            records = [json.loads(line) for line in stream]
+        self.assertEqual(records[0], {"tenant_id": 1, "tenant": "Bob", "lease_id": None,
+                                      "amount": 400, "date": "2024-02-03"})
+        self.assertEqual([r["lease_id"] for r in records], [None, None, 0])
+
+    def test_columnar_round_trip(self):
+        export(self.manager, "payments", self.path("payments.col"), "columnar", chunk_rows=2)
+        with open(self.path("payments.col"), "rb") as stream:
+            rows = list(read_columnar(stream))
+        self.assertEqual(rows, [("1", "Bob", None, "400", "2024-02-03"),
+                                ("1", "Bob", None, "600", "2024-03-03"),
+                                ("0", "Alice", "0", "1500", "2024-01-05")])
+
+    def test_unloaded_histories_are_streamed_not_cached(self):
+        loads = []
+
+        def load():
+            loads.append(1)
+            return ({"amount": n, "date": "2024-01-01"} for n in (10, 20))
+        carol = self.manager.add_tenant("Carol", "5550000000", "carol@example.com", payment_loader=load)
+        self.assertEqual(export(self.manager, "payments", self.path("payments.csv")), 5)
+        self.assertFalse(is_loaded(carol, "payment_history"))
+        self.assertEqual(export(self.manager, "payments", self.path("again.csv")), 5)
+        self.assertEqual(len(loads), 2)
+        self.assertEqual([p["amount"] for p in carol.payment_history], [10, 20])
+
+    def test_unknown_format_or_dataset_writes_nothing(self):
+        with self.assertRaises(ValueError):
+            self.manager.export_report("leases", self.path("out.parquet"), "parquet")
+        with self.assertRaises(ValueError):
+            self.manager.export_report("invoices", self.path("out.csv"))
+        self.assertEqual(os.listdir(self.directory.name), [])
+
+    def test_writer_errors_reach_the_caller(self):
+        pipeline = ExportPipeline(io.BytesIO(), ("n",), "jsonl", chunk_rows=1, max_chunks=1)
+        pipeline._writer._stream = FailingStream()
+        with self.assertRaises(OSError):
+            pipeline.write((n,) for n in range(50))
+        with self.assertRaises(OSError):
+            pipeline.close()
+        self.assertEqual(pipeline.rows, 0)
+
+    def test_write_stops_reading_rows_once_the_writer_fails(self):
+        pipeline = ExportPipeline(io.BytesIO(), ("n",), "jsonl", chunk_rows=1, max_chunks=1)
+        pipeline._writer._stream = FailingStream()
+        with self.assertRaises(OSError):
+            pipeline.write((n,) for n in itertools.count())
+        with self.assertRaises(OSError):
+            pipeline.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
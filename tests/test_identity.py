@@ -0,0 +1,116 @@
+import unittest
+from apartment_manager.apartment_manager import Apartment, ApartmentManager, Lease, Tenant
+from apartment_manager.identity import EntityList, EntityTable, InternTable
+
+
+class TestIdentityTables(unittest.TestCase):
+
+    def test_intern_table_assigns_dense_ids(self):
+        keys = InternTable()
+        self.assertEqual([keys.intern(k) for k in ("101", "102", "101")], [0, 1, 0])
+        self.assertEqual(keys.get("102"), 1)
+        self.assertIsNone(keys.get("103"))
+        self.assertEqual(keys.keys, ["101", "102"])
+
+    def test_entity_table_never_reuses_ids(self):
+        table = EntityTable()
+        first, second = table.add("a"), table.add("b")
+        table.remove(first)
+        self.assertIsNone(table.get(first))
+        self.assertEqual(table.add("c"), 2)
+        self.assertEqual(list(table), ["b", "c"])
+        self.assertEqual(len(table), 2)
+        self.assertIsNone(table.get("b"))
+
+    def test_entity_list_keeps_order_and_removes_in_place(self):
+        items = EntityList(["a", "b", "c"])
+        items.append("d")
+        items.remove("b")
+        self.assertEqual(items, ["a", "c", "d"])
+        self.assertEqual((items[0], items[-1], items[1:]), ("a", "d", ["c", "d"]))
+        self.assertIn("c", items)
+        with self.assertRaises(ValueError):
+            items.remove("b")
+        with self.assertRaises(IndexError):
+            items[3]
+
+
+class TestEntityIds(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = ApartmentManager()
+        self.manager.add_apartment("101", 2, 1, 1500)
+        self.manager.add_apartment("102", 1, 1, 1000)
+        self.first = self.manager.add_tenant("Alex Kim", "1234567890", "alex@example.com")
+        self.second = self.manager.add_tenant("Alex Kim", "5550000000", "alex.kim@example.com")
+
+    def test_duplicate_names_are_told_apart_by_id(self):
+        self.assertEqual(self.manager.tenant_ids("Alex Kim"), [self.first.id, self.second.id])
+        self.manager.lease_apartment(self.second.id, "102", "2024-01-01", "2024-12-31")
+        self.assertEqual(self.first.balance_due, 0)
+        self.assertEqual(self.second.balance_due, 1000)
+        self.manager.make_payment(self.second.id, 400)
+        self.assertEqual(self.manager.tenant_profile(self.second.id).balance_due, 600)
+        self.manager.delete_tenant(self.second.id)
+        self.assertIs(self.manager.find_tenant("Alex Kim"), self.first)
+
+    def test_lookups_by_id(self):
+        apartment = self.manager.find_apartment("101")
+        self.assertIs(self.manager.apartment_by_id(apartment.id), apartment)
+        lease = self.manager.lease_apartment("Alex Kim", "101", "2024-01-01", "2024-12-31")
+        self.assertIs(self.manager.lease_by_id(lease.id), lease)
+        self.assertEqual(apartment.leases, {lease.id: lease})
+        self.manager.submit_maintenance_request("101", "Leaky faucet")
+        request = apartment.maintenance_requests[0]
+        self.assertIs(self.manager.maintenance_request_by_id(request["id"]), request)
+
+    def test_deleted_ids_are_not_reused(self):
+        apartment = self.manager.find_apartment("101")
+        self.manager.lease_apartment("Alex Kim", "101", "2024-01-01", "2024-12-31")
+        self.manager.delete_apartment("101")
+        self.assertIsNone(self.manager.apartment_by_id(apartment.id))
+        self.assertIsNone(self.manager.find_apartment("101"))
+        readded = self.manager.add_apartment("101", 3, 2, 2500)
+        self.assertNotEqual(readded.id, apartment.id)
+        self.assertIs(self.manager.find_apartment("101"), readded)
+        self.assertEqual(len(self.manager.lease_table), 0)
+
+    def test_change_feed_carries_ids(self):
+        adds = [c for c in self.manager.changes.since(0) if c.op == "add"]
+        self.assertEqual([(c.entity, c.data["id"]) for c in adds],
+                         [("apartment", 0), ("apartment", 1), ("tenant", 0), ("tenant", 1)])
+
+    def test_every_change_names_the_entity_id(self):
+        self.manager.lease_apartment(self.second.id, "101", "2024-01-01", "2024-12-31")
+        self.manager.make_payment(self.second.id, 100)
+        self.manager.apply_fees([self.second.id], 25)
+        self.manager.apply_late_fees(10)
+        self.manager.post_payments([(self.second.id, 50)])
+        self.manager.extend_lease("101", "2025-06-30")
+        self.manager.set_rent("102", 1100)
+        self.manager.submit_maintenance_request("101", "Leaky faucet")
+        self.manager.assign_maintenance_staff("101", "John")
+        self.manager.update_maintenance_status("101", 0, "Completed")
+        self.manager.delete_apartment("101")
+        self.manager.delete_tenant(self.second.id)
+        changes = self.manager.changes.since(0)
+        self.assertEqual([c for c in changes if "id" not in c.data], [])
+        payment = next(c for c in changes if c.entity == "payment")
+        self.assertEqual((payment.key, payment.data["id"]), ("Alex Kim", self.second.id))
+        self.assertEqual({c.data["id"] for c in changes if c.entity == "tenant" and c.op != "add"},
+                         {self.second.id})
+
+
+class TestLeaseBackReferences(unittest.TestCase):
+
+    def test_leases_built_without_an_id_do_not_collide(self):
+        tenant = Tenant("Alice", "1234567890", "alice@example.com")
+        apartment = Apartment("101", 2, 1, 1500)
+        first = Lease(tenant, apartment, "2024-01-01", "2024-06-30")
+        second = Lease(tenant, apartment, "2024-07-01", "2024-12-31")
+        self.assertEqual(list(tenant.leases.values()), [first, second])
+        self.assertEqual(list(apartment.leases.values()), [first, second])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+import unittest
+from datetime import date
+from apartment_manager.apartment_manager import ApartmentManager
+
+
+class TestOccupancyHistory(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = ApartmentManager()
+        for unit in ("101", "102", "103", "104"):
+            self.manager.add_apartment(unit, 2, 1, 1500)
+        self.manager.add_tenant("Alice", "1234567890", "alice@example.com")
+        self.manager.add_tenant("Bob", "9876543210", "bob@example.com")
+        self.manager.lease_apartment("Alice", "101", "2024-01-01", "2024-06-30")
+        self.manager.lease_apartment("Bob", "102", "2024-06-15", "2025-06-14")
+
+    def test_point_in_time_occupancy(self):
+        self.assertIn("Occupied Apartments: 2", self.manager.apartment_occupancy_report("2024-06-30"))
+        self.assertIn("Occupied Apartments: 1", self.manager.apartment_occupancy_report("2024-07-01"))
+        report = self.manager.apartment_occupancy_report(date(2023, 12, 31))
+        self.assertIn("Occupied Apartments: 0", report)
+        self.assertIn("Occupancy Rate: 0.00%", report)
+
+    def test_vacancy_windows(self):
+        self.assertEqual(self.manager.vacant_units("2024-07-01", "2024-12-31"), ["101", "103", "104"])
+        self.assertEqual(self.manager.vacant_units("2024-06-01", "2024-06-14"), ["102", "103", "104"])
+        self.assertEqual(self.manager.vacant_units("2024-06-30", "2024-06-30"), ["103", "104"])
+
+    def test_index_follows_extension_and_termination(self):
+        self.manager.extend_lease("101", "2024-12-31")
+        self.assertNotIn("101", self.manager.vacant_units("2024-07-01", "2024-12-31"))
+        self.assertIn("Occupied Apartments: 2", self.manager.apartment_occupancy_report("2024-09-01"))
+        self.manager.terminate_lease("102")
+        self.assertIn("Occupied Apartments: 1", self.manager.apartment_occupancy_report("2024-09-01"))
+        self.assertEqual(self.manager.vacant_units("2025-01-01", "2025-02-01"), ["101", "102", "103", "104"])
+        self.manager.delete_tenant("Alice")
+        self.assertEqual(len(self.manager.lease_intervals), 0)
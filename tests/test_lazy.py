@@ -0,0 +1,53 @@
+import os
+import subprocess
+import sys
+import unittest
+from apartment_manager.apartment_manager import ApartmentManager
+from apartment_manager.lazy import is_loaded
+
+
+class TestLazyHydration(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = ApartmentManager()
+        self.loads = []
+
+    def _loader(self, rows):
+        def load():
+            self.loads.append(rows)
+            return rows
+        return load
+
+    def test_payment_history_loads_on_first_access(self):
+        rows = [{"amount": 100, "date": "2024-01-01"}]
+        tenant = self.manager.add_tenant("Alice", "1234567890", "alice@example.com",
+                                         payment_loader=self._loader(rows))
+        self.assertFalse(is_loaded(tenant, "payment_history"))
+        self.assertEqual(tenant.get_payment_history(), "$100 on 2024-01-01")
+        tenant.make_payment(50)
+        self.assertEqual(len(tenant.payment_history), 2)
+        self.assertEqual(len(self.loads), 1)
+
+    def test_maintenance_requests_load_on_first_access(self):
+        rows = [{"request": "Fix AC", "status": "Pending"}]
+        self.manager.add_apartment("101", 2, 1, 1500, maintenance_loader=self._loader(rows))
+        apartment = self.manager.find_apartment("101")
+        self.assertFalse(is_loaded(apartment, "maintenance_requests"))
+        self.assertIn("Fix AC", self.manager.track_maintenance_status())
+        self.assertTrue(is_loaded(apartment, "maintenance_requests"))
+
+    def test_assignment_skips_loader(self):
+        tenant = self.manager.add_tenant("Alice", "1234567890", "alice@example.com",
+                                         payment_loader=self._loader([{"amount": 1, "date": "x"}]))
+        tenant.payment_history = []
+        self.assertEqual(tenant.get_payment_history(), "No payments made.")
+        self.assertEqual(self.loads, [])
+
+    def test_optional_modules_are_not_imported_at_startup(self):
+        code = ("import sys, main; "
+                "print(sorted(m for m in ('json', 'apartment_manager.bulk', "
+                "'apartment_manager.projection') if m in sys.modules))")
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                                check=True, cwd=root)
+        self.assertEqual(result.stdout.strip(), "[]")
@@ -0,0 +1,74 @@
+import unittest
+from datetime import datetime
+from apartment_manager.apartment_manager import ApartmentManager
+from apartment_manager.maintenance import MaintenanceStats
+
+
+class TestMaintenanceStats(unittest.TestCase):
+
+    def test_lifecycle_latencies(self):
+        stats = MaintenanceStats()
+        request = {"request": "Fix AC", "status": "Pending"}
+        stats.submitted("101", request, datetime(2024, 1, 1, 9))
+        stats.assigned("101", request, "John", datetime(2024, 1, 1, 11))
+        stats.status_changed("101", request, "In Progress", datetime(2024, 1, 1, 12))
+        stats.status_changed("101", request, "Completed", datetime(2024, 1, 3, 9))
+
+        self.assertEqual(request["timestamps"]["In Progress"], datetime(2024, 1, 1, 12))
+        self.assertEqual(stats.time_to_assign.counts, [0, 1, 0, 0, 0, 0])
+        self.assertEqual(stats.time_to_close.counts, [0, 0, 0, 1, 0, 0])
+        self.assertEqual(stats.time_to_close.mean_hours, 48)
+        self.assertEqual(stats.staff_time_to_close["John"].count, 1)
+        self.assertEqual(+stats.by_status, {"Completed": 1})
+        self.assertEqual(+stats.by_staff["John"], {"Completed": 1})
+        self.assertEqual(stats.open_backlog("101"), 0)
+
+    def test_reassignment_moves_staff_counters(self):
+        stats = MaintenanceStats()
+        request = {"request": "Fix AC", "status": "Pending"}
+        stats.submitted("101", request, datetime(2024, 1, 1, 9))
+        stats.assigned("101", request, "John", datetime(2024, 1, 1, 10))
+        stats.assigned("101", request, "Mary", datetime(2024, 1, 2, 10))
+        self.assertEqual(+stats.by_staff["John"], {})
+        self.assertEqual(+stats.by_staff["Mary"], {"Pending": 1})
+        self.assertEqual(stats.time_to_assign.count, 1)
+        self.assertEqual(request["assigned_at"], datetime(2024, 1, 1, 10))
+
+
+class TestMaintenanceDashboard(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = ApartmentManager()
+        self.manager.add_apartment("101", 2, 1, 1500)
+        self.manager.add_apartment("102", 3, 2, 2000)
+        self.manager.submit_maintenance_request("101", "Fix AC")
+        self.manager.submit_maintenance_request("101", "Fix heater")
+        self.manager.submit_maintenance_request("102", "Fix door")
+
+    def test_dashboard_counts(self):
+        self.manager.assign_maintenance_staff("101", "John")
+        self.assertEqual(self.manager.update_maintenance_status("101", 0, "Completed"),
+                         "Request 0 for Unit 101 marked Completed.")
+        self.assertEqual(self.manager.update_maintenance_status("101", 5, "Completed"),
+                         "Maintenance request not found.")
+        dashboard = self.manager.maintenance_dashboard().splitlines()
+        self.assertEqual(dashboard[0], "Requests by status: Pending: 2, Completed: 1")
+        self.assertEqual(dashboard[1], "Open backlog: 2")
+        self.assertTrue(dashboard[2].startswith("Time to assign: 2 requests"))
+        self.assertTrue(dashboard[3].startswith("Time to close: 1 requests"))
+        self.assertTrue(dashboard[4].startswith("Staff John: 1 open, closed 1 requests"))
+        self.assertIn("Completed", self.manager.maintenance_stats.by_unit["101"])
+
+    def test_status_changes_on_the_apartment_keep_counters_in_step(self):
+        apartment = self.manager.find_apartment("101")
+        apartment.update_request_status(0, "Completed")
+        self.manager.update_maintenance_status("101", 0, "Closed")
+        stats = self.manager.maintenance_stats
+        self.assertEqual(+stats.by_status, {"Pending": 2, "Closed": 1})
+        self.assertEqual(stats.time_to_close.count, 1)
+        self.assertEqual(stats.open_backlog("101"), 1)
+
+    def test_deleting_a_unit_drops_its_backlog(self):
+        self.manager.delete_apartment("101")
+        self.assertEqual(self.manager.maintenance_stats.open_backlog(), 1)
+        self.assertEqual(self.manager.maintenance_stats.open_backlog("101"), 0)
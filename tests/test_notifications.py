@@ -0,0 +1,103 @@
+import os
+import tempfile
+import threading
+import unittest
+from apartment_manager.apartment_manager import ApartmentManager
+from apartment_manager.notifications import FileSink, Notice, NotificationPipeline
+
+
+class RecordingSink:
+
+    def __init__(self, fail_for=None):
+        self.batches = []
+        self.fail_for = fail_for
+        self._lock = threading.Lock()
+
+    def deliver(self, tenant, channel, notices):
+        if tenant == self.fail_for:
+            raise RuntimeError("sink unavailable")
+        with self._lock:
+            self.batches.append((tenant, channel, list(notices)))
+
+
+def notice(tenant, key, channel="email", tenant_id=None):
+    tenant_id = tenant if tenant_id is None else tenant_id
+    return Notice(tenant_id, tenant, f"{tenant}@example.com", channel, "balance_due", key, f"{tenant} owes ${key}")
+
+
+class TestNotificationPipeline(unittest.TestCase):
+
+    def test_dedupes_and_batches_per_tenant_and_channel(self):
+        sink = RecordingSink()
+        with NotificationPipeline(sink, workers=2, batch_size=2) as pipeline:
+            accepted = pipeline.submit([
+                notice("alice", 1), notice("alice", 1), notice("alice", 2),
+                notice("alice", 3), notice("bob", 1), notice("bob", 1, channel="sms"),
+            ])
+        self.assertEqual(accepted, 5)
+        self.assertEqual(pipeline.delivered, 5)
+        sizes = sorted((tenant, channel, len(batch)) for tenant, channel, batch in sink.batches)
+        self.assertEqual(sizes, [("alice", "email", 1), ("alice", "email", 2),
+                                 ("bob", "email", 1), ("bob", "sms", 1)])
+
+    def test_tenants_sharing_a_name_are_kept_apart(self):
+        sink = RecordingSink()
+        with NotificationPipeline(sink) as pipeline:
+            accepted = pipeline.submit([notice("alex", 1, tenant_id=1), notice("alex", 1, tenant_id=2)])
+        self.assertEqual(accepted, 2)
+        self.assertEqual(sorted(len(batch) for _, _, batch in sink.batches), [1, 1])
+        self.assertEqual({batch[0].tenant_id for _, _, batch in sink.batches}, {1, 2})
+
+    def test_failures_are_collected(self):
+        sink = RecordingSink(fail_for="bob")
+        with NotificationPipeline(sink) as pipeline:
+            pipeline.submit([notice("alice", 1), notice("bob", 1)])
+        self.assertEqual(pipeline.delivered, 1)
+        self.assertEqual(len(pipeline.failures), 1)
+
+    def test_bounded_queue_with_many_batches(self):
+        sink = RecordingSink()
+        with NotificationPipeline(sink, workers=3, batch_size=1, max_pending=2) as pipeline:
+            pipeline.submit(notice(f"t{i}", i) for i in range(200))
+        self.assertEqual(len(sink.batches), 200)
+
+
+class TestReminderNotices(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = ApartmentManager()
+        self.manager.add_apartment("101", 2, 1, 1500)
+        self.manager.add_apartment("102", 3, 2, 2000)
+        self.manager.add_tenant("Alice", "1234567890", "alice@example.com")
+        self.manager.add_tenant("Bob", "9876543210", "bob@example.com")
+        self.manager.lease_apartment("Alice", "101", "2024-01-01", "2024-06-30")
+        self.manager.lease_apartment("Bob", "102", "2024-01-01", "2024-12-31")
+
+    def test_notices(self):
+        self.manager.make_payment("Bob", 2000)
+        notices = list(self.manager.reminder_notices(today="2024-06-15", within_days=30))
+        self.assertEqual([(n.tenant, n.kind) for n in notices],
+                         [("Alice", "lease_expiring"), ("Alice", "balance_due")])
+        notices = list(self.manager.reminder_notices(today="2025-01-15", channel="sms"))
+        self.assertEqual([(n.kind, n.address) for n in notices][:2],
+                         [("lease_overdue", "1234567890"), ("lease_overdue", "9876543210")])
+
+    def test_same_name_tenants_get_their_own_reminders(self):
+        self.manager.add_tenant("Alice", "5550000000", "other.alice@example.com")
+        self.manager.lease_apartment(2, "101", "2024-07-01", "2024-12-31")
+        sink = RecordingSink()
+        self.manager.send_reminders(sink, today="2025-01-15")
+        addresses = {frozenset(n.address for n in batch) for _, _, batch in sink.batches}
+        self.assertIn(frozenset({"alice@example.com"}), addresses)
+        self.assertIn(frozenset({"other.alice@example.com"}), addresses)
+
+    def test_send_reminders_to_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "reminders.txt")
+            message = self.manager.send_reminders(FileSink(path), today="2024-12-15")
+            with open(path) as stream:
+                lines = stream.read().splitlines()
+        self.assertEqual(message, "4 reminder(s) delivered.")
+        self.assertEqual(len(lines), 4)
+        self.assertTrue(any(line.startswith("Alice\temail\talice@example.com\tlease_overdue")
+                            for line in lines))
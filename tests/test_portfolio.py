@@ -0,0 +1,47 @@
+import unittest
+from datetime import date, timedelta
+from apartment_manager.portfolio import Portfolio
+
+
+class TestPortfolio(unittest.TestCase):
+
+    def setUp(self):
+        self.portfolio = Portfolio()
+        for property_id in ("north", "south"):
+            self.portfolio.add_property(property_id)
+            self.portfolio.route(property_id, "add_apartment", "101", 2, 1, 1500)
+            self.portfolio.route(property_id, "add_tenant", "Alice", "1234567890", "alice@example.com")
+        self.portfolio.route("south", "add_apartment", "102", 3, 2, 2000)
+        today = date.today()
+        self.portfolio.route("north", "lease_apartment", "Alice", "101",
+                             today - timedelta(days=30), today + timedelta(days=335))
+
+    def test_unit_numbers_do_not_collide(self):
+        self.assertFalse(self.portfolio.manager("north").find_apartment("101").is_available)
+        self.assertTrue(self.portfolio.manager("south").find_apartment("101").is_available)
+
+    def test_unknown_or_duplicate_property(self):
+        with self.assertRaises(ValueError):
+            self.portfolio.route("east", "list_apartments")
+        with self.assertRaises(ValueError):
+            self.portfolio.add_property("north")
+
+    def test_search_fans_out_and_merges(self):
+        results = self.portfolio.search_apartments(max_rent=1600)
+        self.assertEqual(results, ["[south] Apartment 101: 2BR/1BA, $1500/month, Status: Available"])
+        results = self.portfolio.search_apartments(include_occupied=True)
+        self.assertEqual(len(results), 3)
+
+    def test_search_scoped_to_one_property(self):
+        results = self.portfolio.search_apartments(property_ids=["north"])
+        self.assertEqual(results, ["No apartments match the search criteria."])
+
+    def test_reports(self):
+        north = self.portfolio.manager("north")
+        north.extend_lease("101", north.leases[0].start_date)
+        self.assertEqual(self.portfolio.overdue_payments(), ["[north] Alice owes $1500"])
+        self.assertEqual(self.portfolio.generate_outstanding_report(["south"]), "No outstanding balances found.")
+        report = self.portfolio.apartment_occupancy_report()
+        self.assertIn("Total Apartments: 3", report)
+        self.assertIn("Occupied Apartments: 0", report)
+        self.assertEqual(self.portfolio.calculate_total_annual_rent(["south"]), (1500 + 2000) * 12)
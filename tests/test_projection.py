@@ -0,0 +1,58 @@
+import unittest
+from datetime import date
+from apartment_manager.apartment_manager import ApartmentManager
+
+
+class TestRentProjection(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = ApartmentManager()
+        self.manager.add_apartment("101", 2, 1, 1500)
+        self.manager.add_apartment("102", 3, 2, 3000)
+        self.manager.add_tenant("Alice", "1234567890", "alice@example.com")
+        self.manager.add_tenant("Bob", "9876543210", "bob@example.com")
+        self.manager.lease_apartment("Alice", "101", "2024-01-01", "2024-03-31")
+
+    def test_full_months(self):
+        revenue = self.manager.project_monthly_revenue("2024-01-01", "2024-04-30")
+        self.assertEqual(revenue, [
+            (date(2024, 1, 1), 1500),
+            (date(2024, 2, 1), 1500),
+            (date(2024, 3, 1), 1500),
+            (date(2024, 4, 1), 0),
+        ])
+
+    def test_accepts_date_objects(self):
+        self.assertEqual(self.manager.project_monthly_revenue(date(2024, 1, 1), date(2024, 4, 30)),
+                         self.manager.project_monthly_revenue("2024-01-01", "2024-04-30"))
+
+    def test_partial_months_are_prorated(self):
+        self.manager.lease_apartment("Bob", "102", "2024-01-16", "2024-02-14")
+        revenue = dict(self.manager.project_monthly_revenue("2024-01-01", "2024-02-29"))
+        self.assertEqual(revenue[date(2024, 1, 1)], round(1500 + 3000 * 16 / 31, 2))
+        self.assertEqual(revenue[date(2024, 2, 1)], round(1500 + 3000 * 14 / 29, 2))
+
+    def test_vacant_units_do_not_count(self):
+        revenue = self.manager.project_monthly_revenue("2025-01-01", "2025-01-31")
+        self.assertEqual(revenue, [(date(2025, 1, 1), 0)])
+
+    def test_cache_invalidated_by_lease_changes(self):
+        self.manager.project_monthly_revenue("2024-01-01", "2024-06-30")
+        self.manager.extend_lease("101", "2024-05-31")
+        revenue = dict(self.manager.project_monthly_revenue("2024-01-01", "2024-06-30"))
+        self.assertEqual(revenue[date(2024, 5, 1)], 1500)
+
+        self.manager.lease_apartment("Bob", "102", "2024-06-01", "2024-12-31")
+        revenue = dict(self.manager.project_monthly_revenue("2024-01-01", "2024-06-30"))
+        self.assertEqual(revenue[date(2024, 6, 1)], 3000)
+
+        self.manager.terminate_lease("101")
+        revenue = dict(self.manager.project_monthly_revenue("2024-01-01", "2024-06-30"))
+        self.assertEqual(revenue[date(2024, 1, 1)], 0)
+
+    def test_unrelated_horizons_stay_cached(self):
+        self.manager.project_monthly_revenue("2020-01-01", "2020-12-31")
+        self.manager.project_monthly_revenue("2024-01-01", "2024-12-31")
+        self.manager.extend_lease("101", "2024-04-30")
+        self.assertIn((2020 * 12, 2020 * 12 + 11), self.manager.projection._cache)
+        self.assertNotIn((2024 * 12, 2024 * 12 + 11), self.manager.projection._cache)
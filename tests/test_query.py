@@ -0,0 +1,74 @@
+import unittest
+from datetime import date, timedelta
+from apartment_manager.apartment_manager import ApartmentManager
+from apartment_manager.query import Query, available, balance, bathrooms, bedrooms, lease_end, rent
+
+
+class TestQueryPlanner(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = ApartmentManager()
+        for i in range(20):
+            self.manager.add_apartment(str(100 + i), 1 + i % 3, 1 + i % 2, 1000 + 100 * i)
+        self.manager.add_tenant("Alice", "1234567890", "alice@example.com")
+        self.manager.add_tenant("Bob", "9876543210", "bob@example.com")
+        self.manager.lease_apartment("Alice", "105", "2024-01-01", "2024-12-31")
+        self.manager.lease_apartment("Bob", "110", "2024-01-01", "2025-06-30")
+
+    def _units(self, apartments):
+        return [a.unit_number for a in apartments]
+
+    def test_matches_linear_scan(self):
+        predicates = [rent.between(1200, 1800), bedrooms >= 2, bathrooms == 1]
+        expected = [a.unit_number for a in self.manager.apartments
+                    if all(p.matches(a) for p in predicates)]
+        self.assertEqual(self._units(self.manager.query(*predicates)), expected)
+        self.assertEqual(self._units(self.manager.query(rent < 1100, rent > 1000)), [])
+
+    def test_lease_and_balance_predicates(self):
+        self.assertEqual(self._units(self.manager.query(lease_end >= "2025-01-01")), ["110"])
+        self.assertEqual(self._units(self.manager.query(lease_end <= date(2024, 12, 31))), ["105"])
+        self.assertEqual(self._units(self.manager.query(balance > 1500)), ["110"])
+        # Both leases have ended, so neither unit is occupied today.
+        self.assertEqual(len(self.manager.query(available == False)), 0)
+
+    def test_lease_predicates_follow_the_current_booking(self):
+        today = date.today()
+        self.manager.lease_apartment("Alice", "110", today - timedelta(days=10), today + timedelta(days=300))
+        cutoff = today + timedelta(days=200)
+        self.assertEqual(self._units(self.manager.query(lease_end >= cutoff)), ["110"])
+        self.assertEqual(self._units(self.manager.query(lease_end <= date(2025, 6, 30))), ["105"])
+        # Balance follows the current tenant (Alice, $3500), not the earlier lease holder (Bob, $2000).
+        self.assertEqual(self._units(self.manager.query(balance > 2500)), ["105", "110"])
+
+    def test_composition(self):
+        query = (rent >= 1500) & Query(bedrooms == 3)
+        self.manager.lease_apartment("Alice", "108", date.today(), date.today())
+        self.assertEqual(self._units(query.where(available == True).run(self.manager)),
+                         ["105", "111", "114", "117"])
+
+    def test_explain_starts_with_most_selective_index(self):
+        plan = self.manager.explain(bedrooms == 2, rent >= 2800, available == True)
+        lines = plan.splitlines()
+        self.assertEqual(lines[0], "Index scan rent >= 2800: estimated 2 rows, scanned 2 rows")
+        self.assertEqual(lines[1], "Filter available = True: estimated 1 rows, scanned 2 rows")
+        self.assertEqual(lines[2], "Filter bedrooms = 2: estimated 1 rows, scanned 2 rows")
+        self.assertEqual(lines[-1], "Returned 1 rows")
+
+    def test_index_follows_adds_and_deletes(self):
+        self.assertEqual(len(self.manager.query(rent >= 2900)), 1)
+        self.manager.add_apartment("200", 2, 1, 5000)
+        self.manager.delete_apartment("119")
+        self.assertEqual(self._units(self.manager.query(rent >= 2900)), ["200"])
+        self.manager.apartments = []
+        self.assertEqual(self.manager.query(rent >= 0), [])
+
+    def test_direct_attribute_edits_reach_the_index(self):
+        self.assertEqual(len(self.manager.query(rent >= 0)), 20)
+        apartment = self.manager.find_apartment("101")
+        apartment.rent = 5000
+        apartment.bedrooms = 4
+        self.assertEqual(self._units(self.manager.query(rent >= 4000)), ["101"])
+        self.assertEqual(self._units(self.manager.query(bedrooms == 4)), ["101"])
+        self.assertNotIn("101", self._units(self.manager.query(rent <= 1600)))
+        self.assertEqual(len(self.manager.search_apartments(max_rent=1600)), 6)
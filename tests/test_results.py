@@ -0,0 +1,43 @@
+import json
+import unittest
+from datetime import date
+from apartment_manager.apartment_manager import ApartmentManager
+from apartment_manager.results import ApartmentRecord, as_dict, to_json
+
+
+class TestStructuredResults(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = ApartmentManager()
+        self.manager.add_apartment("101", 2, 1, 1500)
+        self.manager.add_apartment("102", 3, 2, 2000)
+        self.manager.add_tenant("Alice", "1234567890", "alice@example.com")
+        self.manager.lease_apartment("Alice", "101", "2023-01-01", "2023-12-31")
+        self.manager.leases[0].add_payment(1500, "2023-01-01")
+
+    def test_records_carry_numbers(self):
+        report = self.manager.monthly_report(2023, 1)
+        self.assertEqual((report.rent_collected, report.outstanding_balances), (1500, 0))
+        occupancy = self.manager.occupancy(date(2023, 6, 1))
+        self.assertEqual((occupancy.total_units, occupancy.occupied_units), (2, 1))
+        self.assertEqual(occupancy.occupancy_rate, 50.0)
+        self.assertEqual(self.manager.occupancy().occupied_units, 0)
+        self.assertEqual(self.manager.average_rent(), 1750)
+        self.assertEqual(self.manager.find_apartments(min_rent=1800),
+                         [ApartmentRecord("102", 3, 2, 2000, True)])
+
+    def test_records_render_the_legacy_text(self):
+        self.assertEqual(str(self.manager.monthly_report(2023, 1)),
+                         self.manager.generate_monthly_report(2023, 1))
+        self.assertEqual(str(self.manager.tenant_profile("Alice")),
+                         "Profile for Alice:\nContact: 1234567890, alice@example.com\nBalance Due: $0\n"
+                         "Leases:\nLease for Alice in 101: 2023-01-01 to 2023-12-31\nPayments:\n$1500 on 2023-01-01")
+        self.assertIsNone(self.manager.tenant_profile("Nobody"))
+
+    def test_json_serialization(self):
+        profile = json.loads(to_json(self.manager.tenant_profile("Alice")))
+        self.assertEqual(profile["leases"][0]["start_date"], "2023-01-01")
+        self.assertEqual(profile["leases"][0]["payments"], [{"amount": 1500, "date": "2023-01-01"}])
+        occupancy = as_dict(self.manager.occupancy(date(2023, 6, 1)))
+        self.assertEqual(occupancy, {"total_units": 2, "occupied_units": 1,
+                                     "occupancy_rate": 50.0, "as_of": "2023-06-01"})
@@ -0,0 +1,45 @@
+import unittest
+from datetime import date
+
+from apartment_manager.simulation import Scenario, run_scenarios, simulate
+
+
+class TestSimulation(unittest.TestCase):
+    def setUp(self):
+        self.scenario = Scenario("small", units=10, tenants=15, months=14, late_fee=25, lease_months=6, seed=3)
+
+    def test_simulate_reports_metrics_and_operation_stats(self):
+        result = simulate(self.scenario)
+        self.assertGreater(result.collected, 0)
+        self.assertGreater(result.average_occupancy, 0)
+        self.assertLessEqual(result.average_occupancy, 100)
+        self.assertEqual(result.maintenance_closed, 14)
+        self.assertEqual(result.operations["add_apartment"].calls, 10)
+        self.assertEqual(result.operations["set_rent"].calls, 10)
+        self.assertIn("create_leases", result.operations)
+
+    def test_aging_follows_simulated_dates(self):
+        # 2001 and 2101 share a calendar, so the aging must not depend on the real date.
+        unpaid = self.scenario._replace(pay_rate=0)
+        early = simulate(unpaid._replace(start=date(2001, 1, 1)))
+        late = simulate(unpaid._replace(start=date(2101, 1, 1)))
+        self.assertEqual(early.over_90_days, late.over_90_days)
+        self.assertGreater(early.over_90_days, 0)
+        self.assertLess(early.over_90_days, early.outstanding)
+
+    def test_simulate_is_deterministic_for_a_seed(self):
+        first = simulate(self.scenario)
+        second = simulate(self.scenario)
+        self.assertEqual(first[:-1], second[:-1])
+        self.assertNotEqual(first[:-1], simulate(self.scenario._replace(seed=4))[:-1])
+
+    def test_run_scenarios_in_process_pool_matches_inline(self):
+        scenarios = [self.scenario, self.scenario._replace(name="no-fee", late_fee=0)]
+        pooled = run_scenarios(scenarios, processes=2)
+        inline = run_scenarios(scenarios, processes=1)
+        self.assertEqual([r[:-1] for r in pooled], [r[:-1] for r in inline])
+        self.assertEqual(pooled[1].fees_charged, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
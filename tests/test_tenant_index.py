@@ -0,0 +1,59 @@
+import unittest
+from apartment_manager.apartment_manager import ApartmentManager
+from apartment_manager.tenant_index import SortedBlocks
+
+
+class TestTenantSearch(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = ApartmentManager()
+        self.manager.add_tenant("Alice Smith", "(123) 456-7890", "Alice@Example.com")
+        self.manager.add_tenant("alan turing", "555-000-1111", "alan@example.com")
+        self.manager.add_tenant("Bob", "9876543210", "bob@example.com")
+
+    def test_find_tenant_by_exact_name(self):
+        self.assertEqual(self.manager.find_tenant("Bob").email, "bob@example.com")
+        self.assertIsNone(self.manager.find_tenant("bob"))
+
+    def test_prefix_search_is_normalized_and_sorted(self):
+        names = [t.name for t in self.manager.search_tenants(prefix="AL")]
+        self.assertEqual(names, ["alan turing", "Alice Smith"])
+        names = [t.name for t in self.manager.search_tenants(prefix="alice  s")]
+        self.assertEqual(names, ["Alice Smith"])
+        self.assertEqual(len(self.manager.search_tenants(prefix="al", limit=1)), 1)
+        self.assertEqual(self.manager.search_tenants(prefix="z"), [])
+
+    def test_phone_and_email_lookup(self):
+        self.assertEqual(self.manager.search_tenants(phone="1234567890")[0].name, "Alice Smith")
+        self.assertEqual(self.manager.search_tenants(email=" alice@example.COM")[0].name, "Alice Smith")
+        self.assertEqual(self.manager.search_tenants(prefix="bo", phone="9876543210")[0].name, "Bob")
+        self.assertEqual(self.manager.search_tenants(prefix="al", phone="9876543210"), [])
+
+    def test_delete_tenant_updates_indexes(self):
+        self.manager.delete_tenant("Alice Smith")
+        self.assertEqual([t.name for t in self.manager.search_tenants(prefix="al")], ["alan turing"])
+        self.assertEqual(self.manager.search_tenants(phone="1234567890"), [])
+        self.assertIsNone(self.manager.find_tenant("Alice Smith"))
+
+    def test_duplicate_names_are_kept(self):
+        self.manager.add_tenant("Bob", "1112223333", "bob2@example.com")
+        self.assertEqual(len(self.manager.search_tenants(prefix="bob")), 2)
+        self.manager.delete_tenant("Bob")
+        self.assertEqual(self.manager.find_tenant("Bob").email, "bob2@example.com")
+
+
+class TestSortedBlocks(unittest.TestCase):
+
+    def test_keys_stay_sorted_across_block_splits_and_removals(self):
+        blocks = SortedBlocks(load=4)
+        keys = [(f"tenant {i * 7 % 50}", i) for i in range(50)]
+        for key in keys:
+            blocks.add(key)
+        self.assertEqual(list(blocks), sorted(keys))
+        for key in keys[::2]:
+            blocks.remove(key)
+        remaining = sorted(keys[1::2])
+        self.assertEqual(list(blocks), remaining)
+        self.assertEqual(len(blocks), 25)
+        self.assertEqual(list(blocks.from_key(("tenant 3",))),
+                         [key for key in remaining if key >= ("tenant 3",)])
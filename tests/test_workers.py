@@ -0,0 +1,24 @@
+import threading
+import unittest
+from apartment_manager.workers import WorkerPool
+
+
+class TestWorkerPool(unittest.TestCase):
+
+    def test_join_waits_for_every_item(self):
+        handled = []
+        lock = threading.Lock()
+
+        def handle(item):
+            with lock:
+                handled.append(item)
+
+        pool = WorkerPool(handle, workers=3, max_pending=2)
+        for item in range(100):
+            pool.put(item)
+        pool.join()
+        self.assertEqual(sorted(handled), list(range(100)))
+
+
+if __name__ == '__main__':
+    unittest.main()